@@ -1,5 +1,7 @@
 import requests
 import logging
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 from .cookie_repository import CookieRepository
 from bs4 import BeautifulSoup
 import json
@@ -47,9 +49,25 @@ class Client(object):
     }
 
     def __init__(
-        self, *, debug=False, refresh_cookies=False, proxies={}, cookies_dir=None
+        self,
+        *,
+        debug=False,
+        refresh_cookies=False,
+        proxies={},
+        cookies_dir=None,
+        pool_maxsize=DEFAULT_POOLSIZE,
     ):
         self.session = requests.session()
+        # Keep enough idle keep-alive connections around that concurrent or
+        # back-to-back requests reuse them instead of doing a new TLS handshake.
+        # Only failed connection attempts are retried: throttled and 5xx
+        # responses must reach the rate limiter so that it can back off.
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.proxies.update(proxies)
         # Use mobile device fingerprint for all requests to maintain consistent identity
         # This prevents LinkedIn from invalidating sessions due to device fingerprint mismatch
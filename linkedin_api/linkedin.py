@@ -2,19 +2,27 @@
 Provides linkedin api-related code
 """
 import base64
+import copy
 from http.client import HTTPException
 import json
 import logging
-import random
-import traceback
+import os
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from operator import itemgetter
-from time import sleep, time
+from time import time
+from typing import List, Optional
 from urllib.parse import quote, urlencode
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE
 
 from .client import Client, UnauthorizedException
+from .utils.rate_limiter import RateLimiter
+from .utils.ttl_cache import TTLCache
 from .utils.helpers import (
     append_update_post_field_to_posts_list,
     get_id_from_urn,
@@ -32,15 +40,543 @@ from .utils.helpers import (
     get_nested
 )
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is an optional, faster drop-in for json.loads/dumps
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+try:
+    import simdjson
+except ImportError:  # simdjson is optional, see _json_project
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, see _loads_with_included_types
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional, see _parse_connections
+    msgspec = None
+
+# Responses whose Content-Length exceeds this are decoded with ijson (when
+# installed) as they arrive rather than read and decoded in full; below it,
+# ijson's overhead outweighs the savings. Content-Length counts the bytes on
+# the wire, so for a gzipped response this is compared with the compressed
+# size, which is several times smaller than the decoded JSON; responses
+# without a Content-Length are always decoded in full
+_STREAM_MIN_SIZE = 512 * 1024
+
+
+def _read_body(res):
+    """
+    Read the body of a response fetched with `stream=True` straight from the
+    socket, then release the connection back to the pool.
+
+    Unlike `res.content`, this does not join the body from a list of chunks.
+    """
+    try:
+        return res.raw.read(decode_content=True)
+    finally:
+        res.close()
+
+
+def _json_project(content, keys, default=None):
+    """
+    Decode only the subtree of a JSON document found under `keys`.
+
+    With simdjson installed the document is parsed lazily and only the
+    requested subtree is turned into Python objects; otherwise the whole
+    document is decoded and walked with `get_nested`.
+    """
+    if simdjson is None:
+        return get_nested(_json_loads(content), keys, default)
+
+    pointer = "".join(f"/{key}" for key in keys)
+    try:
+        value = simdjson.Parser().parse(content).at_pointer(pointer)
+    except (KeyError, IndexError, ValueError):
+        return default
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _stream_loads(raw, keep_included):
+    """
+    Decode the JSON object read from the file-like `raw` in a single ijson
+    pass. Every top-level key is kept, but the `included` entities are built
+    one at a time and dropped unless `keep_included(entity)` is true.
+    """
+    data = {"included": []}
+    key = builder = None
+    is_entity = False
+    depth = 0
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is None:
+            if prefix == "":
+                if event == "map_key":
+                    key = value
+                continue
+            if prefix == "included" and event in ("start_array", "end_array"):
+                continue
+            builder = ijson.ObjectBuilder()
+            is_entity = prefix == "included.item"
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            if not is_entity:
+                if key != "included":
+                    data[key] = builder.value
+            elif keep_included(builder.value):
+                data["included"].append(builder.value)
+            builder = None
+    return data
+
+
+def _loads_with_included_types(res, included_types):
+    """
+    Decode a response fetched with `stream=True`, keeping only the `included`
+    entities whose `$type` is one of `included_types`.
+
+    Large responses (see `_STREAM_MIN_SIZE`) are decoded with ijson, when it
+    is installed, as they are read from the socket, so neither the body nor
+    the dropped entities are ever held in full. Both paths return the same
+    top-level keys.
+    """
+
+    def keep_included(item):
+        return item.get("$type") in included_types
+
+    if ijson is not None and int(res.headers.get("Content-Length") or 0) > _STREAM_MIN_SIZE:
+        res.raw.decode_content = True
+        try:
+            return _stream_loads(res.raw, keep_included)
+        finally:
+            res.close()
+    data = _json_loads(_read_body(res))
+    data["included"] = [item for item in data.get("included") or () if keep_included(item)]
+    return data
+
+
 logger = logging.getLogger(__name__)
 
+# A search page's URL is _SEARCH_URL_PREFIX, its start offset, then the
+# formatted _SEARCH_URL_QUERY_TEMPLATE, which is the same for every page
+_SEARCH_URL_PREFIX = "/graphql?variables=(start:"
+_SEARCH_URL_QUERY_TEMPLATE = (
+    ",origin:{origin},"
+    "query:("
+    "{keywords}"
+    "flagshipSearchIntent:SEARCH_SRP,"
+    "queryParameters:{filters},"
+    "includeFiltersInResponse:false))&=&queryId=voyagerSearchDashClusters"
+    ".b0928897b71bd00a5a7291755dcd64f0"
+)
+
+# GraphQL query and decoration IDs used by the profile endpoints. These may
+# need to be updated periodically as LinkedIn changes their API; they can be
+# found by inspecting network requests in the browser when viewing a profile.
+_PROFILE_CONTACT_INFO_QUERY_ID = "voyagerIdentityDashProfiles.c7452e58fa37646d09dae4920fc5b4b9"
+_PROFILE_COMPONENTS_QUERY_ID = "voyagerIdentityDashProfileComponents.c5d4db426a0f8247b8ab7bc1d660775a"
+_FULL_PROFILE_DECORATION_ID = "com.linkedin.voyager.dash.deco.identity.profile.FullProfile-76"
+
+_PROFILE_CONTACT_INFO_URL_TEMPLATE = (
+    "/graphql?includeWebMetadata={include_metadata}"
+    "&variables=(memberIdentity:{public_id})"
+    "&queryId=" + _PROFILE_CONTACT_INFO_QUERY_ID
+)
+
 
-def default_evade():
+@lru_cache(maxsize=512)
+def _encode_urn(urn):
     """
-    A catch-all method to try and evade suspension from Linkedin.
-    Currenly, just delays the request by a random (bounded) time
+    URL-encode a URN (e.g. its colons) for use inside GraphQL `variables`.
+    Cached, as the same profile URN is usually sent to several sections.
     """
-    sleep(random.randint(2, 4))  # sleep a random duration to try and evade suspention
+    return quote(urn, safe="")
+
+
+# `urn` must already be URL-encoded
+_PROFILE_SKILLS_URL_TEMPLATE = (
+    "/graphql?variables=(profileUrn:{urn},sectionType:skills,locale:{locale})"
+    "&queryId=" + _PROFILE_COMPONENTS_QUERY_ID
+)
+_PROFILE_EXPERIENCE_URL_TEMPLATE = (
+    "/graphql?variables=(profileUrn:{urn},sectionType:experience,locale:{locale},"
+    "count:{count},start:{start})"
+    "&queryId=" + _PROFILE_COMPONENTS_QUERY_ID
+)
+_PROFILE_EDUCATION_URL_TEMPLATE = (
+    "/graphql?variables=(profileUrn:{urn},sectionType:education,locale:{locale})"
+    "&queryId=" + _PROFILE_COMPONENTS_QUERY_ID
+)
+
+_PROFILE_TYPE = "com.linkedin.voyager.dash.identity.profile.Profile"
+_ENDORSED_SKILL_TYPE = "com.linkedin.voyager.dash.identity.profile.EndorsedSkill"
+_PAGED_LIST_COMPONENT_TYPE = "com.linkedin.voyager.dash.identity.profile.tetris.PagedListComponent"
+_PROFILE_TYPES = frozenset({_PROFILE_TYPE})
+_PROFILE_SKILLS_TYPES = frozenset({_ENDORSED_SKILL_TYPE, _PAGED_LIST_COMPONENT_TYPE})
+
+# Constant query params; requests only reads them, so they are shared by calls
+_COMPANY_DECORATION_ID = "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12"
+_JOB_SEARCH_DECORATION_ID = "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174"
+_JOB_POSTING_PARAMS = {
+    "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
+}
+_ADD_CONNECTION_PARAMS = {
+    "action": "verifyQuotaAndCreateV2",
+    "decorationId": "com.linkedin.voyager.dash.deco.relationships.InvitationCreationResultWithInvitee-2",
+}
+
+# Path to the view count in a `/identity/wvmpCards` response
+_PROFILE_VIEWS_PATH = (
+    "elements",
+    0,
+    "value",
+    "com.linkedin.voyager.identity.me.wvmpOverview.WvmpViewersCard",
+    "insightCards",
+    0,
+    "value",
+    "com.linkedin.voyager.identity.me.wvmpOverview.WvmpSummaryInsightCard",
+    "numViews",
+)
+
+_COLLECTION_RESPONSE_TYPE = "com.linkedin.restli.common.CollectionResponse"
+_SEARCH_CLUSTER_TYPE = "com.linkedin.voyager.dash.search.SearchClusterViewModel"
+_SEARCH_ITEM_TYPE = "com.linkedin.voyager.dash.search.SearchItem"
+_ENTITY_RESULT_TYPE = "com.linkedin.voyager.dash.search.EntityResultViewModel"
+
+
+def _drop_seen(elements, seen):
+    """
+    Return the elements whose `entityUrn` is not in `seen`, and add their URNs
+    to it. Elements without an `entityUrn` are always kept.
+    """
+    unseen = []
+    for element in elements:
+        urn = element.get("entityUrn")
+        if urn is not None:
+            if urn in seen:
+                continue
+            seen.add(urn)
+        unseen.append(element)
+    return unseen
+
+
+def _iter_entity_results(data_clusters):
+    """
+    Yield the entity results of a `searchDashClustersByAll` collection,
+    skipping clusters and items of any other type.
+    """
+    items = chain.from_iterable(
+        cluster.get("items") or ()
+        for cluster in data_clusters.get("elements") or ()
+        if cluster.get("_type") == _SEARCH_CLUSTER_TYPE
+    )
+    for item in items:
+        if item.get("_type") != _SEARCH_ITEM_TYPE:
+            continue
+        entity_result = (item.get("item") or {}).get("entityResult")
+        if entity_result and entity_result.get("_type") == _ENTITY_RESULT_TYPE:
+            yield entity_result
+
+
+# Static headers sent by the web client with GraphQL/dash requests. Per-request
+# headers such as `referer` and `x-li-page-instance` are added on top of these.
+def _x_li_track(client_version):
+    """
+    Return the `x-li-track` header value (compact JSON) the web client sends
+    for `client_version`.
+    """
+    return json.dumps(
+        {
+            "clientVersion": client_version,
+            "mpVersion": client_version,
+            "osName": "web",
+            "timezoneOffset": -4,
+            "timezone": "America/New_York",
+            "deviceFormFactor": "DESKTOP",
+            "mpName": "voyager-web",
+            "displayDensity": 2,
+            "displayWidth": 6400,
+            "displayHeight": 2666,
+        },
+        separators=(",", ":"),
+    )
+
+
+_X_LI_TRACK_39992 = _x_li_track("1.13.39992")
+_X_LI_TRACK_40037 = _x_li_track("1.13.40037")
+
+_NORMALIZED_JSON_HEADERS = {
+    "accept": "application/vnd.linkedin.normalized+json+2.1",
+    "x-restli-protocol-version": "2.0.0",
+}
+_PROFILE_CONTACT_INFO_HEADERS = {
+    **_NORMALIZED_JSON_HEADERS,
+    "x-li-track": _X_LI_TRACK_39992,
+}
+_PROFILE_SKILLS_HEADERS = {
+    **_NORMALIZED_JSON_HEADERS,
+    "x-li-pem-metadata": "Voyager - Profile=view-skills-details",
+    "x-li-track": _X_LI_TRACK_39992,
+}
+_PROFILE_HEADERS = {
+    **_NORMALIZED_JSON_HEADERS,
+    "x-li-track": _X_LI_TRACK_40037,
+    "x-li-lang": "en_US",
+    "x-li-deco-include-micro-schema": "true",
+}
+_COMPOSE_OPTION_HEADERS = {
+    **_NORMALIZED_JSON_HEADERS,
+    "x-li-pem-metadata": "Voyager - Messaging - Course=compose-option-cta",
+    "x-li-track": _X_LI_TRACK_40037,
+}
+
+
+class _RandomPool(object):
+    """
+    Hands out slices of a buffer filled by `os.urandom`, refilling it when it
+    runs out, so that small random ids don't each cost a syscall.
+    """
+
+    def __init__(self, size=4096):
+        self._size = size
+        self._buffer = os.urandom(size)
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def take(self, n):
+        with self._lock:
+            if self._offset + n > self._size:
+                self._buffer = os.urandom(self._size)
+                self._offset = 0
+            start = self._offset
+            self._offset += n
+            return self._buffer[start : self._offset]
+
+
+_random_pool = _RandomPool()
+
+
+def _generate_page_instance_id():
+    """
+    Return a random id for the `x-li-page-instance` header: 16 random bytes,
+    base64-encoded without padding.
+    """
+    return base64.b64encode(_random_pool.take(16)).rstrip(b"=").decode("ascii")
+
+
+def _generate_uuid():
+    """
+    Return a random (version 4) UUID string, like `uuid.uuid4()`.
+    """
+    return str(uuid.UUID(bytes=_random_pool.take(16), version=4))
+
+
+def _get_text(item, key):
+    """
+    Return the `text` of a text view model such as an entity result's `title`,
+    or None if it is missing.
+    """
+    value = item.get(key)
+    return value.get("text") if value else None
+
+
+def _parse_vector_image(image_ref):
+    """
+    Return `{"root_url": ..., "images": {"<w>x<w>": url}}` for the
+    `vectorImage` of a display image reference, or None if it has no usable
+    artifacts.
+    """
+    vector_image = (image_ref or {}).get("vectorImage")
+    if not vector_image:
+        return None
+    root_url = vector_image.get("rootUrl", "")
+    # look each field up once per artifact
+    artifacts = (
+        (artifact.get("width"), artifact.get("fileIdentifyingUrlPathSegment"))
+        for artifact in vector_image.get("artifacts") or ()
+    )
+    images = {
+        f"{width}x{width}": f"{root_url}{segment}"
+        for width, segment in artifacts
+        if width and segment
+    }
+    return {"root_url": root_url, "images": images} if images else None
+
+
+def _extract_picture(profile_data, field, ref_key="displayImageReference"):
+    """
+    Parse the picture stored under `field` of a profile (e.g. `profilePicture`).
+
+    The image reference lives under `ref_key`; it is sometimes present but
+    explicitly null, which is treated the same as missing.
+    """
+    picture = profile_data.get(field)
+    return _parse_vector_image(picture.get(ref_key)) if picture else None
+
+
+def _parse_network_distance(value):
+    """
+    Return the degree of a "DISTANCE_2"-style network distance, or None if it
+    is not one (e.g. "OUT_OF_NETWORK").
+    """
+    prefix, _, degree = value.partition("_")
+    return int(degree) if prefix == "DISTANCE" and degree.isdigit() else None
+
+
+if msgspec is not None:
+
+    class _ConnectedMember(msgspec.Struct):
+        firstName: Optional[str] = None
+        lastName: Optional[str] = None
+        entityUrn: Optional[str] = None
+
+    class _ConnectionElement(msgspec.Struct):
+        connectedMemberResolutionResult: Optional[_ConnectedMember] = None
+
+    class _ConnectionsResponse(msgspec.Struct):
+        elements: Optional[List[_ConnectionElement]] = None
+
+    _connections_decoder = msgspec.json.Decoder(_ConnectionsResponse)
+
+
+def _parse_connections(content):
+    """
+    Return the connections of a `/relationships/dash/connections` response
+    body as `firstName`/`lastName`/`profileUrn` dicts.
+
+    With msgspec installed only those fields are decoded, and the rest of each
+    decorated profile is skipped without building Python objects; otherwise
+    the whole body is decoded. Raises ValueError if the body is not valid JSON.
+    """
+    if msgspec is not None:
+        try:
+            elements = _connections_decoder.decode(content).elements
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        members = (element.connectedMemberResolutionResult for element in elements or ())
+        return [
+            {
+                "firstName": member.firstName,
+                "lastName": member.lastName,
+                "profileUrn": member.entityUrn,
+            }
+            for member in members
+            if member is not None
+        ]
+
+    members = (
+        element.get("connectedMemberResolutionResult")
+        for element in _json_loads(content).get("elements") or ()
+    )
+    return [
+        {
+            "firstName": member.get("firstName"),
+            "lastName": member.get("lastName"),
+            "profileUrn": member.get("entityUrn"),
+        }
+        for member in members
+        if member
+    ]
+
+
+_JOB_POSTING_TYPE = "com.linkedin.voyager.dash.jobs.JobPosting"
+_JOB_POSTING_TYPES = frozenset({_JOB_POSTING_TYPE})
+
+# Read-only defaults for `x.get(key) or _EMPTY` chains, so missing (or null)
+# keys don't allocate a fresh container on every lookup
+_EMPTY = {}
+_EMPTY_LIST = ()
+
+
+def _index_included_by_urn(included):
+    """
+    Map the `entityUrn` of each entity in an `included` array to the entity.
+    The first entity wins if several share a URN.
+    """
+    by_urn = {}
+    for item in included:
+        by_urn.setdefault(item.get("entityUrn"), item)
+    return by_urn
+
+
+# Upper bounds on how long search and feed listings are cached (see
+# `Linkedin._results_cache`); these change faster than profiles or companies
+_TYPEAHEAD_CACHE_TTL = 60
+_SEARCH_CACHE_TTL = 60 * 60
+_POSTS_CACHE_TTL = 5 * 60
+
+# `search_typeahead` result types that have no image, and the preferred image width
+_TYPEAHEAD_TYPES_WITHOUT_IMAGE = frozenset({"GEO", "SKILL", "INDUSTRY"})
+_TYPEAHEAD_IMAGE_WIDTH = 400
+
+
+def _typeahead_detail_data(element):
+    """
+    Return the `detailData` of a typeahead element's first image attribute,
+    or an empty dict if it has none.
+    """
+    attributes = (element.get("image") or _EMPTY).get("attributes")
+    if not attributes:
+        return _EMPTY
+    return attributes[0].get("detailData") or _EMPTY
+
+
+def _typeahead_image_url(detail_data):
+    """
+    Return the URL of the logo or profile picture in a typeahead element's
+    `detailData`, preferring the `_TYPEAHEAD_IMAGE_WIDTH` artifact over the
+    first one, or None if there is no image.
+    """
+    picture = detail_data.get("nonEntityCompanyLogo") or detail_data.get(
+        "nonEntityProfilePicture"
+    )
+    vector_image = picture.get("vectorImage") if picture else None
+    if not vector_image:
+        return None
+    root_url = vector_image.get("rootUrl")
+    artifacts = vector_image.get("artifacts")
+    if not (root_url and artifacts):
+        return None
+    file_segment = next(
+        (
+            artifact.get("fileIdentifyingUrlPathSegment")
+            for artifact in artifacts
+            if artifact.get("width") == _TYPEAHEAD_IMAGE_WIDTH
+        ),
+        None,
+    ) or artifacts[0].get("fileIdentifyingUrlPathSegment")
+    return f"{root_url}{file_segment}" if file_segment else None
+
+
+def _encode_voyager_query(value):
+    """
+    Serialize a value as Rest.li, ready to be put in a URL: dicts become
+    tuples and lists become `List(...)`, e.g.
+    `{"a": "x y", "b": {"c": [1, 2]}}` -> `(a:x%20y,b:(c:List(1,2)))`.
+    Other values are percent-encoded, so that commas, parentheses and colons
+    in them (e.g. in keywords) can't break the structure.
+    """
+    if isinstance(value, dict):
+        return "(" + ",".join(
+            f"{key}:{_encode_voyager_query(item)}" for key, item in value.items()
+        ) + ")"
+    if isinstance(value, (list, tuple)):
+        return "List(" + ",".join(_encode_voyager_query(item) for item in value) + ")"
+    return quote(str(value), safe="")
 
 
 class Linkedin(object):
@@ -51,6 +587,15 @@ class Linkedin(object):
     :type username: str
     :param password: Password of LinkedIn account.
     :type password: str
+    :param max_workers: Maximum number of requests to run concurrently when
+        fetching independent pages. Defaults to 1 (sequential).
+    :type max_workers: int, optional
+    :param cache_ttl: Seconds to keep the results of `get_profile`,
+        `get_profile_contact_info`, `get_company`, `get_school`, `get_job` and
+        the profile privacy/badges/network lookups cached. Search, typeahead,
+        post and comment listings are kept for at most 1 hour, 1 minute,
+        5 minutes and 5 minutes respectively. 0 disables the cache.
+    :type cache_ttl: int, optional
     """
 
     _MAX_POST_COUNT = 100  # max seems to be 100 posts per page
@@ -73,7 +618,9 @@ class Linkedin(object):
         proxies={},
         cookies=None,
         cookies_dir=None,
-        withoutEvade=False
+        withoutEvade=False,
+        max_workers=1,
+        cache_ttl=3600,
     ):
         """Constructor method"""
         self.client = Client(
@@ -81,10 +628,30 @@ class Linkedin(object):
             debug=debug,
             proxies=proxies,
             cookies_dir=cookies_dir,
+            pool_maxsize=max(max_workers, DEFAULT_POOLSIZE),
         )
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
         self.logger = logger
         self.withoutEvade = withoutEvade
+        self.max_workers = max_workers
+        # let a few requests through back to back after an idle spell; the
+        # average rate is still capped by the limiter's requests_per_minute
+        self.rate_limiter = RateLimiter(burst=3)
+        # public ID -> profile URN, filled from `get_profile` responses. A
+        # profile's URN never changes, so entries don't expire and are only
+        # evicted, least recently used first, to bound memory
+        self._profile_urn_cache = TTLCache(maxsize=10000, ttl=float("inf"))
+        # profile URN -> `get_profile` result, and (kind, public ID) ->
+        # privacy settings, member badges and network info
+        self._profile_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._contact_info_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        # (kind, id) -> company, school or job lookups
+        self._lookup_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        # (kind, *args) -> search, typeahead, post and comment listings
+        self._results_cache = TTLCache(maxsize=256, ttl=cache_ttl)
+        # typeahead cache key -> Future of the request in flight for it
+        self._typeahead_pending = {}
+        self._typeahead_lock = threading.Lock()
 
         if authenticate:
             if cookies:
@@ -96,28 +663,57 @@ class Linkedin(object):
 
     def _evade(self):
         if(self.withoutEvade): return
-        else: default_evade()
+        else: self.rate_limiter.wait_if_throttled()
+
+    def _url(self, uri, base_request=False):
+        """Return the absolute URL of `uri` on the API (or, with
+        `base_request`, the site) host."""
+        if base_request:
+            return self.client.LINKEDIN_BASE_URL + uri
+        return self.client.API_BASE_URL + uri
 
     def _fetch(self, uri, evade=None, base_request=False, **kwargs):
         """GET request to Linkedin API"""
         if(evade): evade()
         else: self._evade()
 
-        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.get(url, **kwargs)
+        res = self.client.session.get(self._url(uri, base_request), **kwargs)
+        self.rate_limiter.update(res)
+        return res
 
     def _post(self, uri, evade=None, base_request=False, **kwargs):
         """POST request to Linkedin API"""
         if(evade): evade()
         else: self._evade()
 
-        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.post(url, **kwargs)
+        res = self.client.session.post(self._url(uri, base_request), **kwargs)
+        self.rate_limiter.update(res)
+        return res
+
+    def _resolve_profile_urn(self, public_id):
+        """Return the profile URN for a public ID.
+
+        URNs seen in earlier `get_profile` responses are reused instead of
+        fetching the profile again.
+        """
+        profile_urn = self._profile_urn_cache.get(public_id)
+        if profile_urn:
+            return profile_urn
+
+        profile = self.get_profile(public_id=public_id)
+        profile_urn = profile.get("profile_urn")
+        if profile_urn:
+            self._profile_urn_cache.set(public_id, profile_urn)
+            return profile_urn
+        return f"urn:li:fsd_profile:{profile.get('entityUrn', '').split(':')[-1]}"
 
     def get_profile_posts(self, public_id=None, urn_id=None, post_count=10):
         """
         get_profile_posts: Get profile posts
 
+        Each page is requested with the pagination token of the one before
+        it, so pages are fetched one after another regardless of `max_workers`.
+
         :param public_id: LinkedIn public ID for a profile
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
@@ -137,32 +733,44 @@ class Linkedin(object):
         if urn_id:
             profile_urn = f"urn:li:fsd_profile:{urn_id}"
         else:
-            # Use get_profile to get profile URN
-            profile = self.get_profile(public_id=public_id)
-            profile_urn = profile.get("profile_urn") or f"urn:li:fsd_profile:{profile.get('entityUrn', '').split(':')[-1]}"
+            profile_urn = self._resolve_profile_urn(public_id)
+        cache_key = ("posts", profile_urn, post_count)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         url_params["profileUrn"] = profile_urn
         url = f"/identity/profileUpdatesV2"
-        res = self._fetch(url, params=url_params)
-        data = res.json()
+        res = self._fetch(url, params=url_params, stream=True)
+        data = _json_loads(_read_body(res))
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
             return {}
+        elements = data["elements"]
         while data and data["metadata"]["paginationToken"] != "":
-            if len(data["elements"]) >= post_count:
+            if len(elements) >= post_count:
                 break
             pagination_token = data["metadata"]["paginationToken"]
             url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
             url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            data["metadata"] = res.json()["metadata"]
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
+            res = self._fetch(url, params=url_params, stream=True)
+            data = _json_loads(_read_body(res))
+            if data and "status" in data and data["status"] != 200:
+                self.logger.info("request failed: {}".format(data["message"]))
+                return {}
+            elements.extend(data["elements"])
+
+        del elements[post_count:]
+        self._results_cache.set(cache_key, copy.deepcopy(elements), ttl=_POSTS_CACHE_TTL)
+        return elements
 
     def get_post_comments(self, post_urn, comment_count=100):
         """
         get_post_comments: Get post comments
 
+        Each page is requested with the pagination token of the one before
+        it, so pages are fetched one after another regardless of `max_workers`.
+
         :param post_urn: Post URN
         :type post_urn: str
         :param comment_count: Number of comments to fetch
@@ -176,38 +784,112 @@ class Linkedin(object):
             "q": "comments",
             "sortOrder": "RELEVANCE",
         }
+        cache_key = ("comments", post_urn, comment_count)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         url = f"/feed/comments"
         url_params["updateId"] = "activity:" + post_urn
-        res = self._fetch(url, params=url_params)
-        data = res.json()
+        res = self._fetch(url, params=url_params, stream=True)
+        data = _json_loads(_read_body(res))
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["status"]))
             return {}
+        # a page of nothing but comments already seen ends the paging early
+        seen_urns = set()
+        elements = _drop_seen(data["elements"], seen_urns)
         while data and data["metadata"]["paginationToken"] != "":
-            if len(data["elements"]) >= comment_count:
+            if len(elements) >= comment_count:
                 break
             pagination_token = data["metadata"]["paginationToken"]
             url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
             url_params["count"] = self._MAX_POST_COUNT
             url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            if res.json() and "status" in res.json() and res.json()["status"] != 200:
+            res = self._fetch(url, params=url_params, stream=True)
+            data = _json_loads(_read_body(res))
+            if data and "status" in data and data["status"] != 200:
                 self.logger.info("request failed: {}".format(data["status"]))
                 return {}
-            data["metadata"] = res.json()["metadata"]
             """ When the number of comments exceed total available 
             comments, the api starts returning an empty list of elements"""
-            if res.json()["elements"] and len(res.json()["elements"]) == 0:
-                break
-            if data["elements"] and len(res.json()["elements"]) == 0:
+            unseen_elements = _drop_seen(data["elements"], seen_urns)
+            if not unseen_elements:
                 break
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
+            elements.extend(unseen_elements)
+
+        del elements[comment_count:]
+        self._results_cache.set(cache_key, copy.deepcopy(elements), ttl=_POSTS_CACHE_TTL)
+        return elements
     
+    def _map_concurrently(self, func, items):
+        """Apply `func` to each of `items`, using up to `max_workers` threads.
+
+        Results are returned in the same order as `items`.
+        """
+        if self.max_workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _search_url_query(params):
+        """Return the part of a `search` page URL that follows its start
+        offset (see `_SEARCH_URL_PREFIX`), which is the same for every page.
+        """
+        keywords = f"keywords:{params['keywords']}," if "keywords" in params else ""
+        return _SEARCH_URL_QUERY_TEMPLATE.format(
+            origin=params.get("origin", "GLOBAL_SEARCH_HEADER"),
+            keywords=keywords,
+            filters=params.get("filters", "List()"),
+        )
+
+    def _fetch_search_page(self, url_query, start):
+        """Fetch and parse a single page of `search` results.
+
+        :param url_query: URL part shared by every page, from `_search_url_query`
+        :type url_query: str
+
+        :return: Tuple of (entity results, paging) on success, None if the
+            response contains no search clusters, or an error dict.
+        :rtype: tuple, None or dict
+        """
+        try:
+            res = self._fetch(f"{_SEARCH_URL_PREFIX}{start}{url_query}", stream=True)
+            res.raise_for_status()
+        except requests.exceptions.HTTPError as error:
+            self.logger.warning("HTTP error occurred: %s", error)
+            if error.response.status_code == 401:
+                return {"status": 401, "message": "Unauthorized"}
+            elif error.response.status_code == 429:
+                return {"status": 429, "message": "Rate limit exceeded"}
+            else:
+                return {"status": error.response.status_code, "message": str(error)}
+        except Exception as err:
+            self.logger.warning("Other error occurred: %s", err)
+            return {"error": str(err), "message": "Network or connection error"}
+
+        data_clusters = _json_project(
+            _read_body(res), ["data", "searchDashClustersByAll"]
+        )
+
+        if not data_clusters:
+            return None
+
+        if data_clusters.get("_type") != _COLLECTION_RESPONSE_TYPE:
+            return None
+
+        new_elements = list(_iter_entity_results(data_clusters))
+
+        return new_elements, data_clusters.get("paging") or {}
+
     def search(self, params, limit=-1, offset=0):
         """Perform a LinkedIn search.
 
+        The first page is always fetched on its own. When `max_workers` is
+        greater than 1, the `total` it reports is used to fetch the remaining
+        pages concurrently.
+
         :param params: Search parameters (see code)
         :type params: dict
         :param limit: Maximum length of the returned list, defaults to -1 (no limit)
@@ -219,105 +901,70 @@ class Linkedin(object):
         :return: List of search results
         :rtype: list
         """
-        count = Linkedin._MAX_SEARCH_COUNT
         if limit is None:
             limit = -1
 
+        cache_key = ("search", tuple(sorted(params.items())), limit, offset)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        url_query = self._search_url_query(params)
         results = []
+        # LinkedIn sometimes repeats results on later pages; only the first
+        # occurrence is kept, and a page of nothing but repeats ends the search.
+        # Pages are requested by the number of results received (`fetched`),
+        # repeats included
+        seen_urns = set()
+        fetched = 0
+        pages_fetched = 0
         while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "count": str(count),
-                "filters": "List()",
-                "origin": "GLOBAL_SEARCH_HEADER",
-                "q": "all",
-                "start": len(results) + offset,
-                "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
-            }
-            default_params.update(params)
-
-            keywords = (
-                f"keywords:{default_params['keywords']},"
-                if "keywords" in default_params
-                else ""
-            )
-
-            try:
-                res = self._fetch(
-                    f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
-                    f"query:("
-                    f"{keywords}"
-                    f"flagshipSearchIntent:SEARCH_SRP,"
-                    f"queryParameters:{default_params['filters']},"
-                    f"includeFiltersInResponse:false))&=&queryId=voyagerSearchDashClusters"
-                    f".b0928897b71bd00a5a7291755dcd64f0"
-                )
-                res.raise_for_status()
-            except requests.exceptions.HTTPError as error:
-                print(f"HTTP error occurred: {error}")
-                if error.response.status_code == 401:
-                    return {"status": 401, "message": "Unauthorized"}
-                elif error.response.status_code == 429:
-                    return {"status": 429, "message": "Rate limit exceeded"}
-                else:
-                    return {"status": error.response.status_code, "message": str(error)}
-            except Exception as err:
-                print(f"Other error occurred: {err}")
-                return {"error": str(err), "message": "Network or connection error"}
-            
-            data = res.json()
-            
-            data_clusters = data.get("data", []).get("searchDashClustersByAll", [])
-
-            if not data_clusters:
+            page = self._fetch_search_page(url_query, fetched + offset)
+            if page is None:
                 return []
+            if isinstance(page, dict):
+                return page
+            new_elements, paging = page
+            fetched += len(new_elements)
+            pages_fetched += 1
 
-            if (
-                not data_clusters.get("_type", [])
-                == "com.linkedin.restli.common.CollectionResponse"
-            ):
-                return []
-
-            new_elements = []
-            for it in data_clusters.get("elements", []):
-                if (
-                    not it.get("_type", [])
-                    == "com.linkedin.voyager.dash.search.SearchClusterViewModel"
-                ):
-                    continue
-
-                for el in it.get("items", []):
-                    if (
-                        not el.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.SearchItem"
-                    ):
-                        continue
-
-                    e = el.get("item", []).get("entityResult", [])
-                    if not e:
-                        continue
-                    if (
-                        not e.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.EntityResultViewModel"
-                    ):
-                        continue
-                    new_elements.append(e)
-
-            results.extend(new_elements)
+            unseen_elements = _drop_seen(new_elements, seen_urns)
+            results.extend(unseen_elements)
 
             # break the loop if we're done searching
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
             if (
                 (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(new_elements) == 0:
+                or pages_fetched >= Linkedin._MAX_REPEATED_REQUESTS
+            ) or len(unseen_elements) == 0:
                 break
 
-            self.logger.debug(f"results grew to {len(results)}")
+            if self.max_workers > 1 and paging.get("total"):
+                # The total is known, so fan out over the remaining pages
+                page_size = paging.get("count") or len(new_elements)
+                stop = paging["total"]
+                if limit > -1:
+                    stop = min(stop, offset + limit)
+                starts = range(fetched + offset, stop, page_size)
+                starts = starts[: Linkedin._MAX_REPEATED_REQUESTS - pages_fetched]
+                pages = self._map_concurrently(
+                    lambda start: self._fetch_search_page(url_query, start), starts
+                )
+                for page in pages:
+                    if isinstance(page, dict):
+                        return page
+                    if not page:
+                        break
+                    unseen_elements = _drop_seen(page[0], seen_urns)
+                    if not unseen_elements:
+                        break
+                    results.extend(unseen_elements)
+                break
+
+            self.logger.debug("results grew to %d", len(results))
 
+        if limit > -1:
+            del results[limit:]
+        self._results_cache.set(cache_key, copy.deepcopy(results), ttl=_SEARCH_CACHE_TTL)
         return results
 
 
@@ -389,50 +1036,32 @@ class Linkedin(object):
         :return: List of profiles (minimal data only)
         :rtype: list
         """
-        filters = ["(key:resultType,value:List(PEOPLE))"]
-        if connection_of:
-            filters.append(f"(key:connectionOf,value:List({connection_of}))")
-        if network_depths:
-            stringify = " | ".join(network_depths)
-            filters.append(f"(key:network,value:List({stringify}))")
-        elif network_depth:
-            filters.append(f"(key:network,value:List({network_depth}))")
-        if regions:
-            stringify = " | ".join(regions)
-            filters.append(f"(key:geoUrn,value:List({stringify}))")
-        if industries:
-            stringify = " | ".join(industries)
-            filters.append(f"(key:industry,value:List({stringify}))")
-        if current_company:
-            stringify = " | ".join(current_company)
-            filters.append(f"(key:currentCompany,value:List({stringify}))")
-        if past_companies:
-            stringify = " | ".join(past_companies)
-            filters.append(f"(key:pastCompany,value:List({stringify}))")
-        if profile_languages:
-            stringify = " | ".join(profile_languages)
-            filters.append(f"(key:profileLanguage,value:List({stringify}))")
-        if nonprofit_interests:
-            stringify = " | ".join(nonprofit_interests)
-            filters.append(f"(key:nonprofitInterest,value:List({stringify}))")
-        if schools:
-            stringify = " | ".join(schools)
-            filters.append(f"(key:schools,value:List({stringify}))")
-        if service_categories:
-            stringify = " | ".join(service_categories)
-            filters.append(f"(key:serviceCategory,value:List({stringify}))")
-        # `Keywords` filter
         keyword_title = keyword_title if keyword_title else title
-        if keyword_first_name:
-            filters.append(f"(key:firstName,value:List({keyword_first_name}))")
-        if keyword_last_name:
-            filters.append(f"(key:lastName,value:List({keyword_last_name}))")
-        if keyword_title:
-            filters.append(f"(key:title,value:List({keyword_title}))")
-        if keyword_company:
-            filters.append(f"(key:company,value:List({keyword_company}))")
-        if keyword_school:
-            filters.append(f"(key:school,value:List({keyword_school}))")
+        # (filter key, list of values); filters without values are left out
+        filter_spec = (
+            ("connectionOf", [connection_of] if connection_of else None),
+            ("network", network_depths or ([network_depth] if network_depth else None)),
+            ("geoUrn", regions),
+            ("industry", industries),
+            ("currentCompany", current_company),
+            ("pastCompany", past_companies),
+            ("profileLanguage", profile_languages),
+            ("nonprofitInterest", nonprofit_interests),
+            ("schools", schools),
+            ("serviceCategory", service_categories),
+            # `Keywords` filter
+            ("firstName", [keyword_first_name] if keyword_first_name else None),
+            ("lastName", [keyword_last_name] if keyword_last_name else None),
+            ("title", [keyword_title] if keyword_title else None),
+            ("company", [keyword_company] if keyword_company else None),
+            ("school", [keyword_school] if keyword_school else None),
+        )
+        filters = ["(key:resultType,value:List(PEOPLE))"]
+        filters.extend(
+            f"(key:{key},value:List({' | '.join(values)}))"
+            for key, values in filter_spec
+            if values
+        )
 
         params = {"filters": "List({})".format(",".join(filters))}
 
@@ -441,32 +1070,45 @@ class Linkedin(object):
 
         data = self.search(params, **kwargs)
 
+        if isinstance(data, dict):
+            return data
+
         results = []
+        append = results.append
         for item in data:
-            if (
-                not include_private_profiles
-                and (item.get("entityCustomTrackingInfo") or {}).get(
-                    "memberDistance", None
-                )
-                == "OUT_OF_NETWORK"
-            ):
+            distance = (item.get("entityCustomTrackingInfo") or {}).get(
+                "memberDistance"
+            )
+            if not include_private_profiles and distance == "OUT_OF_NETWORK":
                 continue
-            results.append(
+            append(
                 {
                     "urn_id": get_id_from_urn(
                         get_urn_from_raw_update(item.get("entityUrn", None))
                     ),
-                    "distance": (item.get("entityCustomTrackingInfo") or {}).get(
-                        "memberDistance", None
-                    ),
-                    "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
-                    "location": (item.get("secondarySubtitle") or {}).get("text", None),
-                    "name": (item.get("title") or {}).get("text", None),
+                    "distance": distance,
+                    "jobtitle": _get_text(item, "primarySubtitle"),
+                    "location": _get_text(item, "secondarySubtitle"),
+                    "name": _get_text(item, "title"),
                 }
             )
 
         return results
 
+    def search_people_bulk(self, queries):
+        """Run several `search_people` searches, using up to `max_workers`
+        concurrent requests.
+
+        :param queries: Keyword arguments for each `search_people` call
+        :type queries: list of dict
+
+        :return: List of `search_people` results, in the same order as `queries`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda query: self.search_people(**query), queries
+        )
+
     def search_companies(
         self,
         keywords=None,
@@ -497,20 +1139,41 @@ class Linkedin(object):
             return data
 
         results = []
+        append = results.append
         for item in data:
-            if not item.get("trackingUrn") or "company" not in item.get("trackingUrn"):
+            tracking_urn = item.get("trackingUrn")
+            if not tracking_urn or "company" not in tracking_urn:
                 continue
-            results.append(
+            append(
                 {
-                    "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
-                    "name": (item.get("title") or {}).get("text", None),
-                    "headline": (item.get("primarySubtitle") or {}).get("text", None),
-                    "subline": (item.get("secondarySubtitle") or {}).get("text", None),
+                    "urn_id": get_id_from_urn(tracking_urn),
+                    "name": _get_text(item, "title"),
+                    "headline": _get_text(item, "primarySubtitle"),
+                    "subline": _get_text(item, "secondarySubtitle"),
                 }
             )
 
         return results
 
+    def _fetch_job_search_page(self, query_string, count, start):
+        """Fetch a single page of `search_jobs` results.
+
+        :param query_string: Encoded query parameters shared by every page
+        :type query_string: str
+
+        :return: Tuple of (job postings, paging)
+        :rtype: tuple
+        """
+        res = self._fetch(
+            f"/voyagerJobsDashJobCards?{query_string}&count={count}&start={start}",
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            stream=True,
+        )
+        # job cards, companies, images etc. are dropped while decoding, and
+        # on large pages never built at all
+        data = _loads_with_included_types(res, _JOB_POSTING_TYPES)
+        return data["included"], get_nested(data, ["data", "paging"]) or {}
+
     def search_jobs(
         self,
         keywords=None,
@@ -562,28 +1225,28 @@ class Linkedin(object):
 
         query = {"origin":"JOB_SEARCH_PAGE_QUERY_EXPANSION"}
         if keywords:
-            query["keywords"] = "KEYWORD_PLACEHOLDER"
+            query["keywords"] = keywords
         if location_name:
-            query["locationFallback"] = "LOCATION_PLACEHOLDER"
+            query["locationFallback"] = location_name
 
         # In selectedFilters()
         query['selectedFilters'] = {}
         if companies:
-            query['selectedFilters']['company'] = f"List({','.join(companies)})"
+            query['selectedFilters']['company'] = companies
         if experience:
-            query['selectedFilters']['experience'] = f"List({','.join(experience)})"
+            query['selectedFilters']['experience'] = experience
         if job_type:
-            query['selectedFilters']['jobType'] = f"List({','.join(job_type)})"
+            query['selectedFilters']['jobType'] = job_type
         if job_title:
-            query['selectedFilters']['title'] = f"List({','.join(job_title)})"
+            query['selectedFilters']['title'] = job_title
         if industries:
-            query['selectedFilters']['industry'] = f"List({','.join(industries)})"
+            query['selectedFilters']['industry'] = industries
         if distance:
-            query['selectedFilters']['distance'] = f"List({distance})"
+            query['selectedFilters']['distance'] = [distance]
         if remote:
-            query['selectedFilters']['workplaceType'] = f"List({','.join(remote)})"
+            query['selectedFilters']['workplaceType'] = remote
 
-        query['selectedFilters']['timePostedRange'] = f"List(r{listed_at})"
+        query['selectedFilters']['timePostedRange'] = [f"r{listed_at}"]
         query["spellCorrectionEnabled"] = "true"
 
         # Query structure:
@@ -601,51 +1264,63 @@ class Linkedin(object):
         #    spellCorrectionEnabled:true
         #  )"
 
-        query = str(query).replace(" ","") \
-                    .replace("'","") \
-                    .replace("KEYWORD_PLACEHOLDER", keywords or "") \
-                    .replace("LOCATION_PLACEHOLDER", location_name or "") \
-                    .replace("{","(") \
-                    .replace("}",")")
+        # Only `count` and `start` change between pages, so encode the rest
+        # once. The query is already URL-safe, so it is not urlencoded again
+        query_string = (
+            urlencode({"decorationId": _JOB_SEARCH_DECORATION_ID, "q": "jobSearch"})
+            + "&query="
+            + _encode_voyager_query(query)
+        )
+        cache_key = ("jobs", query_string, limit, offset)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         results = []
+        pages_fetched = 0
         while True:
             # when we're close to the limit, only fetch what we need to
             if limit > -1 and limit - len(results) < count:
                 count = limit - len(results)
-            default_params = {
-                "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
-                "count": count,
-                "q": "jobSearch",
-                "query": query,
-                "start": len(results) + offset,
-            }
 
-            res = self._fetch(
-                f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}",
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            new_data, paging = self._fetch_job_search_page(
+                query_string, count, len(results) + offset
             )
-            data = res.json()
-
-            elements = data.get("included", [])
-            new_data = [
-                i
-                for i in elements
-                if i["$type"] == 'com.linkedin.voyager.dash.jobs.JobPosting'
-            ]
+            pages_fetched += 1
             # break the loop if we're done searching or no results returned
             if not new_data:
                 break
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
             results.extend(new_data)
             if (
                 (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(elements) == 0:
+                or pages_fetched >= Linkedin._MAX_REPEATED_REQUESTS
+            ):
+                break
+
+            if self.max_workers > 1 and paging.get("total"):
+                # The total is known, so fan out over the remaining pages
+                stop = paging["total"]
+                if limit > -1:
+                    stop = min(stop, offset + limit)
+                starts = range(len(results) + offset, stop, count)
+                starts = starts[: Linkedin._MAX_REPEATED_REQUESTS - pages_fetched]
+                pages = self._map_concurrently(
+                    lambda start: self._fetch_job_search_page(
+                        query_string, count, start
+                    ),
+                    starts,
+                )
+                for new_data, _ in pages:
+                    if not new_data:
+                        break
+                    results.extend(new_data)
                 break
 
-            self.logger.debug(f"results grew to {len(results)}")
+            self.logger.debug("results grew to %d", len(results))
 
+        if limit > -1:
+            del results[limit:]
+        self._results_cache.set(cache_key, copy.deepcopy(results), ttl=_SEARCH_CACHE_TTL)
         return results
 
     def search_typeahead(self, keywords, search_type):
@@ -659,6 +1334,43 @@ class Linkedin(object):
         :return: List of search results
         :rtype: list
         """
+        cache_key = ("typeahead", search_type, keywords)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        # Concurrent calls for the same keywords (e.g. from several threads
+        # serving keystrokes) share a single request
+        with self._typeahead_lock:
+            pending = self._typeahead_pending.get(cache_key)
+            if pending is None:
+                self._typeahead_pending[cache_key] = future = Future()
+        if pending is not None:
+            return copy.deepcopy(pending.result())
+
+        try:
+            search_results = self._fetch_typeahead(keywords, search_type)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(search_results)
+        finally:
+            with self._typeahead_lock:
+                del self._typeahead_pending[cache_key]
+
+        if isinstance(search_results, list):
+            self._results_cache.set(
+                cache_key, copy.deepcopy(search_results), ttl=_TYPEAHEAD_CACHE_TTL
+            )
+        return search_results
+
+    def _fetch_typeahead(self, keywords, search_type):
+        """Fetch and parse `search_typeahead` results.
+
+        :return: List of search results, or an error dict
+        :rtype: list or dict
+        """
 
         def _get_query_for_type():
             """Helper function to get the correct query parameter based on search type."""
@@ -708,66 +1420,37 @@ class Linkedin(object):
 
         # Attempt to parse JSON response
         try:
-            data = res.json()
+            data = _json_loads(res.content)
         except ValueError:
-            print("Response is not in JSON format. Here is the raw response content:")
-            print(res.text)
+            self.logger.warning(
+                "Response is not in JSON format. Here is the raw response content: %s",
+                res.text,
+            )
             return []
 
         # Safely access nested data
-        search_data = data.get("data", {}).get("data", {}).get("searchDashReusableTypeaheadByType", {})
-        elements = search_data.get("elements", [])
+        elements = get_nested(
+            data, ["data", "data", "searchDashReusableTypeaheadByType", "elements"]
+        ) or _EMPTY_LIST
 
         # Set the flag to skip image URL retrieval for specific search types
-        skip_image_url = search_type in ["GEO", "SKILL", "INDUSTRY"]
+        skip_image_url = search_type in _TYPEAHEAD_TYPES_WITHOUT_IMAGE
+        with_urn = search_type == "CONNECTIONS"
 
         search_results = []
         for element in elements:
-            image_url = None
-            profile_urn = None
-
-            # Check for 'CONNECTIONS' type to grab the profile URN
-            if search_type == "CONNECTIONS":
-                detail_data = element.get("image", {}).get("attributes", [{}])[0].get("detailData", {})
-                profile_data = detail_data.get("nonEntityProfilePicture", {})
-                profile_urn = profile_data.get("*profile")
-            
-            # Ensure 'image' and 'attributes' are available
-            if not skip_image_url:
-                image_data = element.get("image", {}).get("attributes", [])
-                if image_data is not None and isinstance(image_data, list) and len(image_data) > 0:
-                    detail_data = image_data[0].get("detailData", {})
-                    non_entity_logo = detail_data.get("nonEntityCompanyLogo") or detail_data.get("nonEntityProfilePicture", {})
-                    vector_image = non_entity_logo.get("vectorImage") if non_entity_logo else None
-                    
-                    if vector_image:
-                        root_url = vector_image.get("rootUrl", None)
-                        file_segment = None
-                        artifacts = vector_image.get("artifacts", [])
-                        
-                        if artifacts and isinstance(artifacts, list) and len(artifacts) > 0:
-                            # Try to find the largest artifact (e.g., 400 width)
-                            for artifact in artifacts:
-                                if artifact.get("width") == 400:
-                                    file_segment = artifact.get("fileIdentifyingUrlPathSegment")
-                                    break
-                            if not file_segment:
-                                file_segment = artifacts[0].get("fileIdentifyingUrlPathSegment")
-                        
-                        if root_url and file_segment:
-                            image_url = f"{root_url}{file_segment}"
-
-            # Add the result to search_results
+            detail_data = _typeahead_detail_data(element)
             search_result = {
-                "title": element.get("title", {}).get("text", "No Title"),
+                "title": element.get("title", _EMPTY).get("text", "No Title"),
                 "objectUrn": element.get("trackingUrn", "No Urn"),
-                "image_url": image_url
+                "image_url": None if skip_image_url else _typeahead_image_url(detail_data),
             }
-            if search_type == "CONNECTIONS":
-                search_result["urn_id"] = profile_urn or None
+            if with_urn:
+                search_result["urn_id"] = (
+                    detail_data.get("nonEntityProfilePicture") or _EMPTY
+                ).get("*profile") or None
             search_results.append(search_result)
 
-            # Return the search results
         return search_results
 
     def get_profile_contact_info(self, public_id=None, urn_id=None, include_web_metadata=True):
@@ -783,8 +1466,6 @@ class Linkedin(object):
         :return: Contact data
         :rtype: dict
         """
-        print(f"=== get_profile_contact_info called with public_id={public_id}, urn_id={urn_id} ===")
-        
         # If urn_id is provided but not public_id, fetch the profile to get public_id
         if urn_id and not public_id:
             profile = self.get_profile(urn_id=urn_id)
@@ -795,42 +1476,38 @@ class Linkedin(object):
         if not public_id:
             raise ValueError("Either public_id or urn_id is required for get_profile_contact_info")
 
-        # GraphQL query ID for profile contact info
-        query_id = "voyagerIdentityDashProfiles.c7452e58fa37646d09dae4920fc5b4b9"
+        cache_key = (public_id, include_web_metadata)
+        cached = self._contact_info_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         # Strip non-ASCII characters (e.g. emoji) from public_id to prevent
         # UnicodeEncodeError in http.client's latin-1 header encoding.
         # LinkedIn vanity URLs can contain emoji but HTTP headers cannot.
         safe_public_id = public_id.encode('ascii', errors='ignore').decode('ascii')
 
-        # Build the variables string
-        variables = f"(memberIdentity:{safe_public_id})"
-
         # Construct the query string manually - LinkedIn expects it exactly as shown
-        include_metadata = "true" if include_web_metadata else "false"
-        query_string = f"includeWebMetadata={include_metadata}&variables={variables}&queryId={query_id}"
-        full_url = f"/graphql?{query_string}"
+        full_url = _PROFILE_CONTACT_INFO_URL_TEMPLATE.format(
+            include_metadata="true" if include_web_metadata else "false",
+            public_id=safe_public_id,
+        )
 
         logger.info(f"Fetching contact info for public_id: {public_id}")
         logger.info(f"Full URL: {full_url}")
 
         # Generate a page instance ID for contact details page
-        random_bytes = bytes([random.randint(0, 255) for _ in range(16)])
-        page_instance_id = base64.b64encode(random_bytes).decode('utf-8').rstrip('=')
+        page_instance_id = _generate_page_instance_id()
         page_instance = f"urn:li:page:d_flagship3_profile_view_base_contact_details;{page_instance_id}"
 
         # Add required headers for GraphQL endpoint
         headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
+            **_PROFILE_CONTACT_INFO_HEADERS,
             "referer": f"https://www.linkedin.com/in/{safe_public_id}/",
             "x-li-page-instance": page_instance,
-            "x-li-track": '{"clientVersion":"1.13.39992","mpVersion":"1.13.39992","osName":"web","timezoneOffset":-4,"timezone":"America/New_York","deviceFormFactor":"DESKTOP","mpName":"voyager-web","displayDensity":2,"displayWidth":6400,"displayHeight":2666}',
         }
         
         try:
-            res = self._fetch(full_url, headers=headers)
-            print(f"Response status: {res.status_code}")
+            res = self._fetch(full_url, headers=headers, stream=True)
             
             # Check for HTTP 401 (session expired)
             if res.status_code == 401:
@@ -847,8 +1524,8 @@ class Linkedin(object):
                 logger.error(f"LinkedIn API returned status {res.status_code} for contact info: {public_id}")
                 return {"status": res.status_code, "message": f"HTTP {res.status_code} error"}
             
-            data = res.json()
-            print(f"Response data keys: {data.keys()}")
+            # Only the Profile entity is read from `included`
+            data = _loads_with_included_types(res, _PROFILE_TYPES)
         except requests.exceptions.RequestException as req_err:
             logger.error(f"Network error fetching contact info for {public_id}: {req_err}")
             return {"status": 500, "message": f"Network error: {str(req_err)}"}
@@ -856,16 +1533,13 @@ class Linkedin(object):
             logger.error(f"Invalid JSON response for contact info {public_id}: {json_err}")
             return {"status": 500, "message": f"Invalid JSON response: {str(json_err)}"}
         except Exception as e:
-            print(f"!!! Error fetching contact info GraphQL: {e}")
-            print(f"!!! URL: {full_url}")
             logger.error(f"Error fetching contact info GraphQL: {e}")
             logger.error(f"URL: {full_url}")
             return {"status": 500, "message": str(e)}
         
         # Debug: Log the response structure
-        logger.debug(f"GraphQL contact info response keys: {data.keys()}")
+        logger.debug("GraphQL contact info response keys: %s", data.keys())
         if "errors" in data:
-            print(f"!!! GraphQL errors found: {data['errors']}")
             logger.error(f"GraphQL errors: {data['errors']}")
             # Return structured error instead of raising exception
             return {"status": 500, "message": f"GraphQL returned errors: {data['errors']}"}
@@ -875,12 +1549,12 @@ class Linkedin(object):
         contact_info = {}
         
         included = data.get("included", [])
-        logger.debug(f"Number of included items: {len(included)}")
+        logger.debug("Number of included items: %d", len(included))
         
         # Find the Profile object in the included array
         profile_data = None
         for item in included:
-            if item.get("$type") == "com.linkedin.voyager.dash.identity.profile.Profile":
+            if item.get("$type") == _PROFILE_TYPE:
                 profile_data = item
                 break
         
@@ -903,42 +1577,21 @@ class Linkedin(object):
                 contact_info["headline"] = headline
             
             # Extract profile picture
-            profile_picture = profile_data.get("profilePicture")
-            if profile_picture:
-                # `displayImageReferenceResolutionResult` is sometimes present
-                # but explicitly null in the GraphQL response, in which case
-                # dict.get(key, {}) returns None — not {} — and the next `.get`
-                # raises AttributeError. Use `or {}` to coalesce null to {}.
-                display_image_ref = profile_picture.get("displayImageReferenceResolutionResult") or {}
-                vector_image = display_image_ref.get("vectorImage")
-                
-                if vector_image:
-                    root_url = vector_image.get("rootUrl", "")
-                    artifacts = vector_image.get("artifacts", [])
-                    
-                    # Build image URLs for different sizes
-                    images = {}
-                    for artifact in artifacts:
-                        width = artifact.get("width")
-                        file_segment = artifact.get("fileIdentifyingUrlPathSegment")
-                        if width and file_segment:
-                            images[f"{width}x{width}"] = f"{root_url}{file_segment}"
-                    
-                    if images:
-                        contact_info["profile_picture"] = {
-                            "root_url": root_url,
-                            "images": images
-                        }
+            picture = _extract_picture(
+                profile_data, "profilePicture", "displayImageReferenceResolutionResult"
+            )
+            if picture:
+                contact_info["profile_picture"] = picture
             
             # Extract email
-            email_obj = profile_data.get("emailAddress", {})
+            email_obj = profile_data.get("emailAddress")
             if email_obj and isinstance(email_obj, dict):
                 email = email_obj.get("emailAddress")
                 if email:
                     contact_info["email_address"] = email
             
             # Extract websites
-            websites = profile_data.get("websites", [])
+            websites = profile_data.get("websites")
             if websites:
                 # Parse website objects to match JavaScript parser expectations
                 parsed_websites = []
@@ -955,7 +1608,7 @@ class Linkedin(object):
                 contact_info["websites"] = parsed_websites
             
             # Extract twitter handles
-            twitter_handles = profile_data.get("twitterHandles", [])
+            twitter_handles = profile_data.get("twitterHandles")
             if twitter_handles:
                 # Parse to match JavaScript parser expectations (expects objects with 'name' property)
                 parsed_twitter = []
@@ -978,12 +1631,12 @@ class Linkedin(object):
                 }
             
             # Extract phone numbers
-            phone_numbers = profile_data.get("phoneNumbers", [])
+            phone_numbers = profile_data.get("phoneNumbers")
             if phone_numbers:
                 # Parse phone number objects
                 parsed_phones = []
                 for phone in phone_numbers:
-                    phone_obj = phone.get("phoneNumber", {})
+                    phone_obj = phone.get("phoneNumber")
                     if phone_obj:
                         parsed_phones.append({
                             "number": phone_obj.get("number"),
@@ -992,7 +1645,7 @@ class Linkedin(object):
                 contact_info["phone_numbers"] = parsed_phones
             
             # Extract instant messengers
-            ims = profile_data.get("instantMessengers", [])
+            ims = profile_data.get("instantMessengers")
             if ims:
                 # Parse to match JavaScript parser expectations (expects 'provider' and 'name')
                 parsed_ims = []
@@ -1010,16 +1663,21 @@ class Linkedin(object):
             address = profile_data.get("address")
             if address:
                 contact_info["address"] = address
-        
+
+        self._contact_info_cache.set(cache_key, copy.deepcopy(contact_info))
         return contact_info
 
-    def get_profile_skills(self, urn_id=None, locale="en_US"):
+    def get_profile_skills(self, urn_id=None, locale="en_US", skills_only=False):
         """Fetch the skills listed on a given LinkedIn profile.
 
         :param urn_id: LinkedIn URN ID for a profile (e.g., 'ACoAAAZ_m9sBjNJI6ZqXy2dacAAipjGGjPQEAZY')
         :type urn_id: str
         :param locale: Locale for the response (default: en_US)
         :type locale: str, optional
+        :param skills_only: Only keep the `included` entities the skills are
+            parsed from (EndorsedSkill and PagedListComponent) in `raw_data`,
+            so that large responses are streamed rather than decoded in full
+        :type skills_only: bool, optional
 
         :return: Skills data from GraphQL response
         :rtype: dict
@@ -1033,52 +1691,31 @@ class Linkedin(object):
         else:
             profile_urn = urn_id
         
-        # Build the variables string exactly as LinkedIn expects
-        # Note: sectionType and locale appear to be string literals without quotes in the GraphQL query
-        variables = f"(profileUrn:{profile_urn},sectionType:skills,locale:{locale})"
-        
-        # GraphQL query ID for profile components
-        # Note: This queryId may need to be updated periodically as LinkedIn changes their API
-        # The queryId can be found by inspecting network requests in the browser when viewing a profile's skills section
-        query_id = "voyagerIdentityDashProfileComponents.c5d4db426a0f8247b8ab7bc1d660775a"
-        
-        # Try alternative query IDs if the primary one fails
-        # These are common variations that LinkedIn uses
-        alternative_query_ids = [
-            "voyagerIdentityDashProfileComponents.c5d4db426a0f8247b8ab7bc1d660775a",
-            "voyagerIdentityDashProfileComponents.d6d4db426a0f8247b8ab7bc1d660775a",
-        ]
-        
         # Construct the query string manually (like search_typeahead does)
         # This ensures proper URL encoding that LinkedIn expects
-        # We need to URL-encode the URN colons but keep the parentheses and commas unencoded
-        # Encode only the URN part (the colons need to be %3A)
-        encoded_urn = profile_urn.replace(":", "%3A")
-        encoded_variables = f"(profileUrn:{encoded_urn},sectionType:skills,locale:{locale})"
-        query_string = f"variables={encoded_variables}&queryId={query_id}"
-        full_url = f"/graphql?{query_string}"
+        # Only the URN is encoded (its colons become %3A); the parentheses and
+        # commas of the variables, and sectionType/locale, are sent as-is
+        full_url = _PROFILE_SKILLS_URL_TEMPLATE.format(
+            urn=_encode_urn(profile_urn), locale=locale
+        )
         
         # Generate a page instance ID (LinkedIn uses this to track page context)
         # Format: urn:li:page:d_flagship3_profile_view_base_skills_details;{random_id}
-        random_bytes = bytes([random.randint(0, 255) for _ in range(16)])
-        page_instance_id = base64.b64encode(random_bytes).decode('utf-8').rstrip('=')
+        page_instance_id = _generate_page_instance_id()
         page_instance = f"urn:li:page:d_flagship3_profile_view_base_skills_details;{page_instance_id}"
         
         # Add required headers for GraphQL endpoint
         headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
+            **_PROFILE_SKILLS_HEADERS,
             "referer": f"https://www.linkedin.com/in/{urn_id}/details/skills/",
             "x-li-page-instance": page_instance,
-            "x-li-pem-metadata": "Voyager - Profile=view-skills-details",
-            "x-li-track": '{"clientVersion":"1.13.39992","mpVersion":"1.13.39992","osName":"web","timezoneOffset":-4,"timezone":"America/New_York","deviceFormFactor":"DESKTOP","mpName":"voyager-web","displayDensity":2,"displayWidth":6400,"displayHeight":2666}',
         }
         
-        logger.info(f"Fetching skills for {urn_id} with query ID: {query_id}")
-        logger.debug(f"Request URL: {full_url}")
+        logger.info(f"Fetching skills for {urn_id}")
+        logger.debug("Request URL: %s", full_url)
         
         try:
-            res = self._fetch(full_url, headers=headers)
+            res = self._fetch(full_url, headers=headers, stream=True)
             
             # Check for HTTP 401 (session expired) - BEFORE fuse limit check
             if res.status_code == 401:
@@ -1096,7 +1733,10 @@ class Linkedin(object):
                 logger.error(f"Response: {res.text[:500]}")  # Log first 500 chars
                 return {"status": res.status_code, "message": f"HTTP {res.status_code} error"}
             
-            data = res.json()
+            if skills_only:
+                data = _loads_with_included_types(res, _PROFILE_SKILLS_TYPES)
+            else:
+                data = _json_loads(res.content)
             
             # Log the response structure for debugging
             logger.info(f"Skills API response keys for {urn_id}: {list(data.keys())}")
@@ -1113,8 +1753,7 @@ class Linkedin(object):
             logger.error(f"Invalid JSON response for profile skills {urn_id}: {json_err}")
             return {"status": 500, "message": f"Invalid JSON response: {str(json_err)}"}
         except Exception as e:
-            logger.error(f"Unexpected error fetching profile skills for {urn_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error fetching profile skills for %s: %s", urn_id, e)
             return {"status": 500, "message": str(e)}
         
         # Parse the GraphQL response to extract skills in a format similar to the legacy endpoint
@@ -1147,90 +1786,91 @@ class Linkedin(object):
                 logger.info(f"Profile {urn_id} appears to have no skills listed")
                 return data
             
-            # First, build a map of entityUrn to endorsement data from EndorsedSkill objects
+            # In one pass, map entityUrn to (endorsementCount, endorsedByViewer)
+            # from EndorsedSkill objects and collect the PagedListComponents;
+            # every other entity is skipped
             endorsed_skills_map = {}
+            paged_lists = []
             for item in included:
-                try:
-                    if item.get("$type") == "com.linkedin.voyager.dash.identity.profile.EndorsedSkill":
-                        entity_urn = item.get("entityUrn")
-                        if entity_urn:
-                            endorsed_skills_map[entity_urn] = {
-                                "endorsementCount": item.get("endorsementCount", 0),
-                                "endorsedByViewer": item.get("endorsedByViewer", False)
-                            }
-                except Exception as e:
-                    logger.warning(f"Error parsing endorsed skill item: {e}")
-                    continue  # Skip this item but continue processing others
-            
-            # Now extract skills from PagedListComponent
-            for item in included:
-                try:
-                    # Look for PagedListComponent items which contain the skills
-                    if item.get("$type") == "com.linkedin.voyager.dash.identity.profile.tetris.PagedListComponent":
-                        components = item.get("components", {})
-                        elements = components.get("elements", [])
+                item_type = item.get("$type")
+                if item_type == _ENDORSED_SKILL_TYPE:
+                    entity_urn = item.get("entityUrn")
+                    if entity_urn:
+                        endorsed_skills_map[entity_urn] = (
+                            item.get("endorsementCount", 0),
+                            item.get("endorsedByViewer", False),
+                        )
+                elif item_type == _PAGED_LIST_COMPONENT_TYPE:
+                    paged_lists.append(item)
+            
+            # Now extract skills from PagedListComponent. Malformed elements
+            # are skipped by the type checks below rather than per-element
+            # try/except; anything unexpected is caught by the outer handler.
+            get_endorsed_skill = endorsed_skills_map.get
+            for item in paged_lists:
+                # PagedListComponent items contain the skills
+                components = item.get("components") or _EMPTY
+                elements = components.get("elements") or _EMPTY_LIST
+                
+                for element in elements:
+                    if not isinstance(element, dict):
+                        continue
+                    # Each element contains an entityComponent with the skill details
+                    components_dict = element.get("components")
+                    if not components_dict or not isinstance(components_dict, dict):
+                        continue
                         
-                        for element in elements:
-                            try:
-                                # Each element contains an entityComponent with the skill details
-                                components_dict = element.get("components")
-                                if not components_dict or not isinstance(components_dict, dict):
-                                    continue
-                                    
-                                entity_component = components_dict.get("entityComponent", {})
-                                
-                                if entity_component:
-                                    # Extract the skill name from titleV2
-                                    title_v2 = entity_component.get("titleV2")
-                                    if not title_v2 or not isinstance(title_v2, dict):
-                                        continue
-                                    text_obj = title_v2.get("text")
-                                    if not text_obj or not isinstance(text_obj, dict):
-                                        continue
-                                    skill_name = text_obj.get("text")
-                                    
-                                    if skill_name:
-                                        skill_obj = {"name": skill_name}
-                                        
-                                        # Try to find the entityUrn from the action component
-                                        entity_urn = None
-                                        sub_components = entity_component.get("subComponents", {})
-                                        sub_component_list = sub_components.get("components", [])
-                                        
-                                        for sub_comp in sub_component_list:
-                                            action_comp = sub_comp.get("components", {}).get("actionComponent", {})
-                                            if action_comp:
-                                                action = action_comp.get("action", {})
-                                                endorsed_skill_action = action.get("endorsedSkillAction", {})
-                                                if endorsed_skill_action:
-                                                    # Extract the URN reference (starts with *)
-                                                    entity_urn = endorsed_skill_action.get("*endorsedSkill")
-                                                    break
-                                        
-                                        # Add entityUrn if found
-                                        if entity_urn:
-                                            skill_obj["entityUrn"] = entity_urn
-                                            
-                                            # Get endorsement data from the map
-                                            if entity_urn in endorsed_skills_map:
-                                                skill_obj["numEndorsements"] = endorsed_skills_map[entity_urn]["endorsementCount"]
-                                                skill_obj["endorsedByViewer"] = endorsed_skills_map[entity_urn]["endorsedByViewer"]
-                                            else:
-                                                skill_obj["numEndorsements"] = 0
-                                        else:
-                                            skill_obj["numEndorsements"] = 0
-                                        
-                                        skills.append(skill_obj)
-                            except Exception as e:
-                                logger.warning(f"Error parsing skill element: {e}")
-                                continue  # Skip this element but continue processing others
-                except Exception as e:
-                    logger.warning(f"Error parsing PagedListComponent item: {e}")
-                    continue  # Skip this item but continue processing others
+                    entity_component = components_dict.get("entityComponent")
+                    if not entity_component or not isinstance(entity_component, dict):
+                        continue
+                    
+                    # Extract the skill name from titleV2
+                    title_v2 = entity_component.get("titleV2")
+                    if not title_v2 or not isinstance(title_v2, dict):
+                        continue
+                    text_obj = title_v2.get("text")
+                    if not text_obj or not isinstance(text_obj, dict):
+                        continue
+                    skill_name = text_obj.get("text")
+                    if not skill_name:
+                        continue
+                    
+                    skill_obj = {"name": skill_name}
+                    
+                    # Try to find the entityUrn from the action component
+                    entity_urn = None
+                    sub_components = entity_component.get("subComponents") or _EMPTY
+                    sub_component_list = sub_components.get("components") or _EMPTY_LIST
+                    
+                    for sub_comp in sub_component_list:
+                        if not isinstance(sub_comp, dict):
+                            continue
+                        action_comp = (sub_comp.get("components") or _EMPTY).get("actionComponent")
+                        if action_comp:
+                            action = action_comp.get("action") or _EMPTY
+                            endorsed_skill_action = action.get("endorsedSkillAction")
+                            if endorsed_skill_action:
+                                # Extract the URN reference (starts with *)
+                                entity_urn = endorsed_skill_action.get("*endorsedSkill")
+                                break
+                    
+                    # Add entityUrn if found
+                    if entity_urn:
+                        skill_obj["entityUrn"] = entity_urn
+                        
+                        # Get endorsement data from the map
+                        endorsed_skill = get_endorsed_skill(entity_urn)
+                        if endorsed_skill is not None:
+                            skill_obj["numEndorsements"], skill_obj["endorsedByViewer"] = endorsed_skill
+                        else:
+                            skill_obj["numEndorsements"] = 0
+                    else:
+                        skill_obj["numEndorsements"] = 0
+                    
+                    skills.append(skill_obj)
                     
         except Exception as e:
-            logger.error(f"Error parsing skills data for {urn_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Error parsing skills data for %s: %s", urn_id, e)
             # Return raw response even on parsing errors to allow error detection
             return data
         
@@ -1281,25 +1921,23 @@ class Linkedin(object):
                 f"Use search_people() to find the URN for public_id: {public_id}"
             )
 
-        # GraphQL decoration ID for full profile
-        decoration_id = "com.linkedin.voyager.dash.deco.identity.profile.FullProfile-76"
-        
+        # a bare ID and its fsd_profile URN share one cache entry
+        cache_key = candidate_profile_urns[0]
+        cached = self._profile_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         def _build_profile_url(profile_urn_value: str) -> str:
-            return f"/identity/dash/profiles/{profile_urn_value}?decorationId={decoration_id}"
+            return f"/identity/dash/profiles/{profile_urn_value}?decorationId={_FULL_PROFILE_DECORATION_ID}"
         
         # Generate a page instance ID
-        random_bytes = bytes([random.randint(0, 255) for _ in range(16)])
-        page_instance_id = base64.b64encode(random_bytes).decode('utf-8').rstrip('=')
+        page_instance_id = _generate_page_instance_id()
         page_instance = f"urn:li:page:d_flagship3_profile_view_base;{page_instance_id}"
         
         # Add required headers
         headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
+            **_PROFILE_HEADERS,
             "x-li-page-instance": page_instance,
-            "x-li-track": '{"clientVersion":"1.13.40037","mpVersion":"1.13.40037","osName":"web","timezoneOffset":-4,"timezone":"America/New_York","deviceFormFactor":"DESKTOP","mpName":"voyager-web","displayDensity":2,"displayWidth":6400,"displayHeight":2666}',
-            "x-li-lang": "en_US",
-            "x-li-deco-include-micro-schema": "true",
         }
         
         last_http_error = None
@@ -1308,7 +1946,7 @@ class Linkedin(object):
         for candidate_urn in candidate_profile_urns:
             full_url = _build_profile_url(candidate_urn)
             try:
-                res = self._fetch(full_url, headers=headers)
+                res = self._fetch(full_url, headers=headers, stream=True)
                 res.raise_for_status()
                 break
             except requests.exceptions.HTTPError as error:
@@ -1333,10 +1971,12 @@ class Linkedin(object):
         if last_exception is not None and (not locals().get('res') or res is None):
             return {"error": str(last_exception), "message": "Network or connection error"}
         
-        data = res.json()
-        
+        # every `included` entity may be needed, so ijson would drop nothing
+        # and only be slower than a full decode
+        data = _json_loads(_read_body(res))
         # Extract the main profile data
         profile_data = data.get("data", {})
+        included_by_urn = _index_included_by_urn(data.get("included", []))
         
         # Parse and clean up the profile data
         profile = {}
@@ -1359,19 +1999,22 @@ class Linkedin(object):
         if profile_data.get("trackingId"):
             profile["tracking_id"] = profile_data["trackingId"]
         
+        if profile.get("public_identifier") and profile.get("profile_urn"):
+            self._profile_urn_cache.set(profile["public_identifier"], profile["profile_urn"])
+
         # Premium status
         profile["premium"] = profile_data.get("premium", False)
         profile["show_premium_badge"] = profile_data.get("showPremiumSubscriberBadge", False)
         
         # Location
-        location = profile_data.get("location", {})
+        location = profile_data.get("location")
         if location:
             profile["location"] = {
                 "country_code": location.get("countryCode"),
                 "postal_code": location.get("postalCode")
             }
         
-        geo_location = profile_data.get("geoLocation", {})
+        geo_location = profile_data.get("geoLocation")
         if geo_location:
             geo_urn = geo_location.get("geoUrn")
             profile["geo_location"] = {
@@ -1380,72 +2023,31 @@ class Linkedin(object):
             }
             
             # Try to find location name in included array
-            if geo_urn:
-                included = data.get("included", [])
-                for item in included:
-                    if item.get("entityUrn") == geo_urn:
-                        if item.get("defaultLocalizedName"):
-                            profile["geo_location"]["name"] = item.get("defaultLocalizedName")
-                        if item.get("defaultLocalizedNameWithoutCountryName"):
-                            profile["geo_location"]["name_without_country"] = item.get("defaultLocalizedNameWithoutCountryName")
-                        break
+            item = included_by_urn.get(geo_urn) if geo_urn else None
+            if item:
+                if item.get("defaultLocalizedName"):
+                    profile["geo_location"]["name"] = item.get("defaultLocalizedName")
+                if item.get("defaultLocalizedNameWithoutCountryName"):
+                    profile["geo_location"]["name_without_country"] = item.get("defaultLocalizedNameWithoutCountryName")
         
         # Profile picture
-        profile_picture = profile_data.get("profilePicture", {})
-        if profile_picture:
-            display_image_ref = profile_picture.get("displayImageReference", {})
-            vector_image = display_image_ref.get("vectorImage")
-            
-            if vector_image:
-                root_url = vector_image.get("rootUrl", "")
-                artifacts = vector_image.get("artifacts", [])
-                
-                images = {}
-                for artifact in artifacts:
-                    width = artifact.get("width")
-                    file_segment = artifact.get("fileIdentifyingUrlPathSegment")
-                    if width and file_segment:
-                        images[f"{width}x{width}"] = f"{root_url}{file_segment}"
-                
-                if images:
-                    profile["profile_picture"] = {
-                        "root_url": root_url,
-                        "images": images
-                    }
+        picture = _extract_picture(profile_data, "profilePicture")
+        if picture:
+            profile["profile_picture"] = picture
         
         # Background picture
-        background_picture = profile_data.get("backgroundPicture", {})
-        if background_picture:
-            display_image_ref = background_picture.get("displayImageReference", {})
-            vector_image = display_image_ref.get("vectorImage")
-            
-            if vector_image:
-                root_url = vector_image.get("rootUrl", "")
-                artifacts = vector_image.get("artifacts", [])
-                
-                images = {}
-                for artifact in artifacts:
-                    width = artifact.get("width")
-                    file_segment = artifact.get("fileIdentifyingUrlPathSegment")
-                    if width and file_segment:
-                        images[f"{width}x{width}"] = f"{root_url}{file_segment}"
-                
-                if images:
-                    profile["background_picture"] = {
-                        "root_url": root_url,
-                        "images": images
-                    }
+        picture = _extract_picture(profile_data, "backgroundPicture")
+        if picture:
+            profile["background_picture"] = picture
         
         # Industry
         if profile_data.get("industryUrn"):
             profile["industry_urn"] = profile_data["industryUrn"]
             
             # Try to find industry name in included array
-            included = data.get("included", [])
-            for item in included:
-                if item.get("entityUrn") == profile_data["industryUrn"]:
-                    profile["industry_name"] = item.get("name")
-                    break
+            item = included_by_urn.get(profile_data["industryUrn"])
+            if item:
+                profile["industry_name"] = item.get("name")
         
         # Birthdate
         birthdate = profile_data.get("birthDateOn")
@@ -1455,10 +2057,68 @@ class Linkedin(object):
                 "day": birthdate.get("day"),
                 "year": birthdate.get("year")
             }
-        
+
+        self._profile_cache.set(cache_key, copy.deepcopy(profile))
         return profile
 
-    def get_profile_experience(self, profile_urn, locale="en_US", count=20, start=0):
+    def clear_profile_cache(self):
+        """Forget everything cached about profiles, e.g. after a profile has
+        been edited: the results of `get_profile`, `get_profile_contact_info`,
+        `get_profile_privacy_settings`, `get_profile_member_badges` and
+        `get_profile_network_info`, and the public ID to URN mapping.
+        """
+        self._profile_cache.clear()
+        self._contact_info_cache.clear()
+        self._profile_urn_cache.clear()
+
+    def get_profiles_bulk(self, urn_ids):
+        """Fetch several profiles, using up to `max_workers` concurrent requests.
+
+        :param urn_ids: LinkedIn URN IDs of the profiles
+        :type urn_ids: list
+
+        :return: List of profile data, in the same order as `urn_ids`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda urn_id: self.get_profile(urn_id=urn_id), urn_ids
+        )
+
+    def get_profile_skills_bulk(self, urn_ids, locale="en_US"):
+        """Fetch the skills of several profiles, using up to `max_workers`
+        concurrent requests.
+
+        :param urn_ids: LinkedIn URN IDs of the profiles
+        :type urn_ids: list
+        :param locale: Locale for the responses (default: en_US)
+        :type locale: str, optional
+
+        :return: List of skills data, in the same order as `urn_ids`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda urn_id: self.get_profile_skills(urn_id=urn_id, locale=locale),
+            urn_ids,
+        )
+
+    def get_profile_contact_info_bulk(self, public_ids):
+        """Fetch the contact info of several profiles, using up to
+        `max_workers` concurrent requests.
+
+        :param public_ids: LinkedIn public IDs of the profiles
+        :type public_ids: list
+
+        :return: List of contact data, in the same order as `public_ids`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda public_id: self.get_profile_contact_info(public_id=public_id),
+            public_ids,
+        )
+
+    def get_profile_experience(
+        self, profile_urn, locale="en_US", count=20, start=0, included_types=None
+    ):
         """Fetch work experience using ProfileComponents endpoint.
         
         This method retrieves complete work experience data including:
@@ -1478,6 +2138,10 @@ class Linkedin(object):
         :type count: int, optional
         :param start: Starting index for pagination (default: 0)
         :type start: int, optional
+        :param included_types: If given, only keep the `included` entities
+            whose `$type` is in this set. It must contain the
+            PagedListComponent type for parse_experience_response to work.
+        :type included_types: set, optional
         
         :return: Raw experience data (use parse_experience_response to parse)
         :rtype: dict
@@ -1486,25 +2150,17 @@ class Linkedin(object):
         if not profile_urn.startswith("urn:li:fsd_profile:"):
             profile_urn = f"urn:li:fsd_profile:{profile_urn}"
         
-        # GraphQL query ID for ProfileComponents
-        query_id = "voyagerIdentityDashProfileComponents.c5d4db426a0f8247b8ab7bc1d660775a"
-        
-        # URL encode URN
-        encoded_urn = quote(profile_urn, safe='')
-        
         # Build variables with sectionType:experience and pagination
-        variables = f"(profileUrn:{encoded_urn},sectionType:experience,locale:{locale},count:{count},start:{start})"
-        full_url = f"/graphql?variables={variables}&queryId={query_id}"
-        
-        # Headers
-        headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
-        }
+        full_url = _PROFILE_EXPERIENCE_URL_TEMPLATE.format(
+            urn=_encode_urn(profile_urn), locale=locale, count=count, start=start
+        )
         
         try:
-            res = self._fetch(full_url, headers=headers)
-            data = res.json()
+            res = self._fetch(full_url, headers=_NORMALIZED_JSON_HEADERS, stream=True)
+            if included_types is None:
+                data = _json_loads(_read_body(res))
+            else:
+                data = _loads_with_included_types(res, included_types)
             
             self.logger.info(
                 f"Fetched experience data - Included entities: {len(data.get('included', []))}"
@@ -1512,11 +2168,10 @@ class Linkedin(object):
             
             return data
         except Exception as e:
-            self.logger.error(f"Failed to fetch profile experience: {e}")
-            traceback.print_exc()
+            self.logger.exception("Failed to fetch profile experience: %s", e)
             return {}
 
-    def get_profile_education(self, profile_urn, locale="en_US"):
+    def get_profile_education(self, profile_urn, locale="en_US", included_types=None):
         """Fetch education using ProfileComponents endpoint.
         
         This method retrieves complete education data including:
@@ -1530,6 +2185,10 @@ class Linkedin(object):
         :type profile_urn: str
         :param locale: Locale for the response (default: 'en_US')
         :type locale: str, optional
+        :param included_types: If given, only keep the `included` entities
+            whose `$type` is in this set. It must contain the
+            PagedListComponent type for parse_education_response to work.
+        :type included_types: set, optional
         
         :return: Raw education data (use parse_education_response to parse)
         :rtype: dict
@@ -1538,25 +2197,17 @@ class Linkedin(object):
         if not profile_urn.startswith("urn:li:fsd_profile:"):
             profile_urn = f"urn:li:fsd_profile:{profile_urn}"
         
-        # GraphQL query ID for ProfileComponents
-        query_id = "voyagerIdentityDashProfileComponents.c5d4db426a0f8247b8ab7bc1d660775a"
-        
-        # URL encode URN
-        encoded_urn = quote(profile_urn, safe='')
-        
         # Build variables with sectionType:education
-        variables = f"(profileUrn:{encoded_urn},sectionType:education,locale:{locale})"
-        full_url = f"/graphql?variables={variables}&queryId={query_id}"
-        
-        # Headers
-        headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
-        }
+        full_url = _PROFILE_EDUCATION_URL_TEMPLATE.format(
+            urn=_encode_urn(profile_urn), locale=locale
+        )
         
         try:
-            res = self._fetch(full_url, headers=headers)
-            data = res.json()
+            res = self._fetch(full_url, headers=_NORMALIZED_JSON_HEADERS, stream=True)
+            if included_types is None:
+                data = _json_loads(_read_body(res))
+            else:
+                data = _loads_with_included_types(res, included_types)
             
             self.logger.info(
                 f"Fetched education data - Included entities: {len(data.get('included', []))}"
@@ -1564,10 +2215,72 @@ class Linkedin(object):
             
             return data
         except Exception as e:
-            self.logger.error(f"Failed to fetch profile education: {e}")
-            traceback.print_exc()
+            self.logger.exception("Failed to fetch profile education: %s", e)
             return {}
 
+    def get_profile_experience_bulk(self, profile_urns, locale="en_US"):
+        """Fetch the first page of work experience of several profiles, using
+        up to `max_workers` concurrent requests.
+
+        :param profile_urns: LinkedIn profile URNs
+        :type profile_urns: list
+        :param locale: Locale for the responses (default: 'en_US')
+        :type locale: str, optional
+
+        :return: List of raw experience data, in the same order as `profile_urns`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda profile_urn: self.get_profile_experience(profile_urn, locale=locale),
+            profile_urns,
+        )
+
+    def get_profile_education_bulk(self, profile_urns, locale="en_US"):
+        """Fetch the education of several profiles, using up to `max_workers`
+        concurrent requests.
+
+        :param profile_urns: LinkedIn profile URNs
+        :type profile_urns: list
+        :param locale: Locale for the responses (default: 'en_US')
+        :type locale: str, optional
+
+        :return: List of raw education data, in the same order as `profile_urns`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda profile_urn: self.get_profile_education(profile_urn, locale=locale),
+            profile_urns,
+        )
+
+    def get_profile_sections(
+        self, profile_urn, sections=("experience", "education", "skills"), locale="en_US"
+    ):
+        """Fetch several ProfileComponents sections of a profile, using up to
+        `max_workers` concurrent requests.
+
+        :param profile_urn: LinkedIn profile URN (e.g., 'ACoAAAvf7-UBk_8MvFoDYosW9PdYq24NTpjzHQA')
+        :type profile_urn: str
+        :param sections: Any of "experience", "education" and "skills"
+        :type sections: tuple, optional
+        :param locale: Locale for the responses (default: 'en_US')
+        :type locale: str, optional
+
+        :return: Section name -> the result of `get_profile_experience`,
+            `get_profile_education` or `get_profile_skills` respectively
+        :rtype: dict
+        """
+        fetchers = {
+            "experience": lambda: self.get_profile_experience(profile_urn, locale=locale),
+            "education": lambda: self.get_profile_education(profile_urn, locale=locale),
+            "skills": lambda: self.get_profile_skills(urn_id=profile_urn, locale=locale),
+        }
+        unknown = set(sections) - fetchers.keys()
+        if unknown:
+            raise ValueError(f"Unknown profile sections: {sorted(unknown)}")
+
+        results = self._map_concurrently(lambda section: fetchers[section](), sections)
+        return dict(zip(sections, results))
+
     def get_profile_connections(self, urn_id):
         """Fetch first-degree connections for a given LinkedIn profile.
 
@@ -1591,12 +2304,9 @@ class Linkedin(object):
         :rtype: list
         """
 
-        # Initialize an empty list to store collected connections
-        collectedConnections = []
-
-        # Wait for 3 seconds before making the request to avoid hitting rate limits
-        sleep(3)
-        print(f"Fetching connections, starting from {len(collectedConnections)}")
+        # Requests are paced by the shared rate limiter in `_fetch`, which only
+        # waits when requests are actually being sent too quickly
+        self.logger.debug("Fetching connections, starting from %d", offset)
 
         try:
             # Fetch connections using LinkedIn API endpoint with provided count and offset
@@ -1617,7 +2327,7 @@ class Linkedin(object):
                 logger.error(f"LinkedIn API returned status {res.status_code} for get_my_connections")
                 return {"status": res.status_code, "message": f"HTTP {res.status_code} error"}
             
-            data = res.json()
+            collectedConnections = _parse_connections(res.content)
         except requests.exceptions.RequestException as req_err:
             logger.error(f"Network error fetching connections: {req_err}")
             return {"status": 500, "message": f"Network error: {str(req_err)}"}
@@ -1628,36 +2338,111 @@ class Linkedin(object):
             logger.error(f"Unexpected error fetching connections: {e}")
             return {"status": 500, "message": str(e)}
 
-        # Extract elements from the response data
-        elements = data.get("elements")
-        
-        # If no elements are found, print a message and return an empty list
-        if not elements:
-            print(f"Stopping! Elements list not found. Found: {len(collectedConnections)} connections.")
-            return []
-        
-        # If elements list is empty, print a message and return an empty list
-        if len(elements) < 1:
-            print(f"Stopping! All connections retrieved. Found: {len(collectedConnections)} connections.")
-            return []
+        # Print the number of connections collected and return the list
+        self.logger.debug("Returning %d connections!", len(collectedConnections))
+        return collectedConnections
 
-        print("completed!")
+    def iter_my_connections(self, count=40, offset=0):
+        """Lazily iterate over first-degree connections for the currently
+        logged in profile.
 
-        # Iterate through the elements to format and collect connections
-        for element in elements:
-            inner = element.get("connectedMemberResolutionResult")
-            if not inner: 
-                continue
-            formattedProfile = {
-                "firstName": inner.get("firstName"),
-                "lastName": inner.get("lastName"),
-                "profileUrn": inner.get("entityUrn"),
-            }
-            collectedConnections.append(formattedProfile)
+        Pages of `count` connections are fetched with `get_my_connections`
+        only as the caller consumes them. Iteration stops at the first short
+        or failed page.
 
-        # Print the number of connections collected and return the list
-        print(f"Returning {len(collectedConnections)} connections!")
-        return collectedConnections
+        :param count: Number of connections to fetch per page
+        :type count: int
+        :param offset: Offset to start fetching connections from
+        :type offset: int
+
+        :return: Generator of dictionaries containing connection details
+        :rtype: generator
+        """
+        while True:
+            connections = self.get_my_connections(count=count, offset=offset)
+            # errors are returned as a status dict rather than a list
+            if not isinstance(connections, list):
+                return
+
+            for connection in connections:
+                yield connection
+
+            if len(connections) < count:
+                return
+            offset += count
+
+    def _fetch_feed_updates_page(self, params, start):
+        """Fetch the elements of a single page of `/feed/updates`."""
+        res = self._fetch(
+            f"/feed/updates",
+            params={**params, "count": Linkedin._MAX_UPDATE_COUNT, "start": start},
+        )
+        return _json_loads(res.content)["elements"]
+
+    def _get_feed_updates(self, params, max_results=None, results=None):
+        """Page through `/feed/updates` with the given query `params` until
+        a page comes back empty, `max_results` is reached or
+        `_MAX_REPEATED_REQUESTS` pages have been requested.
+
+        When `max_workers` is greater than 1, that many pages are fetched at
+        once. The feed often returns short pages before its end, and the
+        pages after a short one were requested at offsets that assumed a full
+        page, so they are discarded and the next batch starts from the
+        updates gathered so far.
+
+        :return: List of update objects, appended to `results` if given
+        :rtype: list
+        """
+        if results is None:
+            results = []
+
+        count = Linkedin._MAX_UPDATE_COUNT
+        pages_fetched = 0
+        exhausted = False
+        while (
+            not exhausted
+            and pages_fetched < Linkedin._MAX_REPEATED_REQUESTS
+            and (max_results is None or len(results) < max_results)
+        ):
+            num_pages = min(
+                self.max_workers, Linkedin._MAX_REPEATED_REQUESTS - pages_fetched
+            )
+            if max_results is not None:
+                # never fetch more pages than are needed to reach max_results
+                num_pages = min(num_pages, -(-(max_results - len(results)) // count))
+            starts = [len(results) + i * count for i in range(num_pages)]
+            pages_fetched += num_pages
+
+            pages = self._map_concurrently(
+                lambda page_start: self._fetch_feed_updates_page(params, page_start),
+                starts,
+            )
+            for elements in pages:
+                if not elements:
+                    exhausted = True
+                    break
+                results.extend(elements)
+                if len(elements) < count:
+                    break
+            self.logger.debug("results grew: %d", len(results))
+
+        return results if max_results is None else results[:max_results]
+
+    def _iter_feed_updates(self, params):
+        """Lazily page through `/feed/updates` with the given query `params`,
+        fetching the next page only once the previous one is consumed.
+
+        :return: Generator of update objects
+        :rtype: generator
+        """
+        start = 0
+        while True:
+            elements = self._fetch_feed_updates_page(params, start)
+            if not elements:
+                return
+            for element in elements:
+                yield element
+            start += len(elements)
 
     def get_company_updates(
         self, public_id=None, urn_id=None, max_results=None, results=None
@@ -1673,41 +2458,31 @@ class Linkedin(object):
         :rtype: list
         """
 
-        if results is None:
-            results = []
+        params = self._company_updates_params(public_id, urn_id)
+        return self._get_feed_updates(params, max_results=max_results, results=results)
 
-        params = {
+    def iter_company_updates(self, public_id=None, urn_id=None):
+        """Lazily iterate over company updates (news activity) for a given
+        LinkedIn company, fetching pages only as they are consumed.
+
+        :param public_id: LinkedIn public ID for a company
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a company
+        :type urn_id: str, optional
+
+        :return: Generator of company update objects
+        :rtype: generator
+        """
+        return self._iter_feed_updates(self._company_updates_params(public_id, urn_id))
+
+    @staticmethod
+    def _company_updates_params(public_id, urn_id):
+        return {
             "companyUniversalName": {public_id or urn_id},
             "q": "companyFeedByUniversalName",
             "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
         }
 
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_company_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
-        )
-
     def get_profile_updates(
         self, public_id=None, urn_id=None, max_results=None, results=None
     ):
@@ -1722,58 +2497,40 @@ class Linkedin(object):
         :rtype: list
         """
 
-        if results is None:
-            results = []
+        params = self._profile_updates_params(public_id, urn_id)
+        return self._get_feed_updates(params, max_results=max_results, results=results)
 
-        params = {
+    def iter_profile_updates(self, public_id=None, urn_id=None):
+        """Lazily iterate over profile updates (newsfeed activity) for a given
+        LinkedIn profile, fetching pages only as they are consumed.
+
+        :param public_id: LinkedIn public ID for a profile
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a profile
+        :type urn_id: str, optional
+
+        :return: Generator of profile update objects
+        :rtype: generator
+        """
+        return self._iter_feed_updates(self._profile_updates_params(public_id, urn_id))
+
+    @staticmethod
+    def _profile_updates_params(public_id, urn_id):
+        return {
             "profileId": {public_id or urn_id},
             "q": "memberShareFeed",
             "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
         }
 
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_profile_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
-        )
-
     def get_current_profile_views(self):
         """Get profile view statistics, including chart data.
 
-        :return: Profile view data
-        :rtype: dict
+        :return: Number of profile views, or None if missing from the response
+        :rtype: int
         """
         res = self._fetch(f"/identity/wvmpCards")
 
-        data = res.json()
-
-        return data["elements"][0]["value"][
-            "com.linkedin.voyager.identity.me.wvmpOverview.WvmpViewersCard"
-        ]["insightCards"][0]["value"][
-            "com.linkedin.voyager.identity.me.wvmpOverview.WvmpSummaryInsightCard"
-        ][
-            "numViews"
-        ]
+        return _json_project(res.content, _PROFILE_VIEWS_PATH)
 
     def get_school(self, public_id):
         """Fetch data about a given LinkedIn school.
@@ -1784,15 +2541,19 @@ class Linkedin(object):
         :return: School data
         :rtype: dict
         """
+        cached = self._lookup_cache.get(("school", public_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         params = {
-            "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
+            "decorationId": _COMPANY_DECORATION_ID,
             "q": "universalName",
             "universalName": public_id,
         }
 
         res = self._fetch(f"/organization/companies?{urlencode(params)}")
 
-        data = res.json()
+        data = _json_loads(res.content)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data))
@@ -1800,6 +2561,7 @@ class Linkedin(object):
 
         school = data["elements"][0]
 
+        self._lookup_cache.set(("school", public_id), copy.deepcopy(school))
         return school
 
     def get_company(self, public_id):
@@ -1811,8 +2573,12 @@ class Linkedin(object):
         :return: Company data dict, or structured error dict with 'status' key on failure
         :rtype: dict
         """
+        cached = self._lookup_cache.get(("company", public_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         params = {
-            "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12",
+            "decorationId": _COMPANY_DECORATION_ID,
             "q": "universalName",
             "universalName": public_id,
         }
@@ -1835,7 +2601,7 @@ class Linkedin(object):
             self.logger.warning(f"get_company: network error for {public_id}: {err}")
             return {"error": str(err), "message": "Network or connection error"}
 
-        data = res.json()
+        data = _json_loads(res.content)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data.get("message", "unknown error")))
@@ -1847,6 +2613,7 @@ class Linkedin(object):
 
         company = data["elements"][0]
 
+        self._lookup_cache.set(("company", public_id), copy.deepcopy(company))
         return company
 
     def get_conversation_details(self, profile_urn_id, public_id=None):
@@ -1872,16 +2639,12 @@ class Linkedin(object):
         url = f"/voyagerMessagingDashComposeOptions/{encoded_urn}"
         
         # Generate page instance ID
-        random_bytes = bytes([random.randint(0, 255) for _ in range(16)])
-        page_instance_id = base64.b64encode(random_bytes).decode('utf-8').rstrip('=')
+        page_instance_id = _generate_page_instance_id()
         page_instance = f"urn:li:page:d_flagship3_profile_view_base;{page_instance_id}"
         
         headers = {
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
+            **_COMPOSE_OPTION_HEADERS,
             "x-li-page-instance": page_instance,
-            "x-li-pem-metadata": "Voyager - Messaging - Course=compose-option-cta",
-            "x-li-track": '{"clientVersion":"1.13.40037","mpVersion":"1.13.40037","osName":"web","timezoneOffset":-4,"timezone":"America/New_York","deviceFormFactor":"DESKTOP","mpName":"voyager-web","displayDensity":2,"displayWidth":6400,"displayHeight":2666}',
         }
         
         # Only add referer header if publicId is provided
@@ -1903,7 +2666,7 @@ class Linkedin(object):
             return {"status": res.status_code, "message": f"LinkedIn API error: {res.status_code}"}
 
         res.encoding = "utf-8"
-        data = res.json()
+        data = _json_loads(res.content)
         
         # Extract conversation URN from the new response format
         # Response structure: { "data": { "composeNavigationContext": { "existingConversationUrn": "urn:li:fsd_conversation:..." } } }
@@ -1933,7 +2696,7 @@ class Linkedin(object):
         res = self._fetch(f"/messaging/conversations", params=params)
 
         res.encoding = "utf-8"
-        return res.json()
+        return _json_loads(res.content)
 
     def get_conversation(self, conversation_urn_id):
         """Fetch data about a given conversation.
@@ -1957,7 +2720,7 @@ class Linkedin(object):
             return {"status": res.status_code, "message": f"LinkedIn API error: {res.status_code}"}
 
         res.encoding = "utf-8"
-        return res.json()
+        return _json_loads(res.content)
 
     def send_message(self, message_body, conversation_urn_id=None, recipients=None, sender_urn_id=None):
         """Send a message to a given conversation.
@@ -1989,7 +2752,7 @@ class Linkedin(object):
         if conversation_urn_id and not recipients:
             message_event = {
                 "eventCreate": {
-                    "originToken": str(uuid.uuid4()),
+                    "originToken": _generate_uuid(),
                     "value": {
                         "com.linkedin.voyager.messaging.create.MessageCreate": {
                             "attributedBody": {
@@ -2006,7 +2769,7 @@ class Linkedin(object):
             res = self._post(
                 f"/messaging/conversations/{conversation_urn_id}/events",
                 params=params,
-                data=json.dumps(message_event),
+                data=_json_dumps(message_event),
             )
             
             if res.status_code == 429:
@@ -2067,7 +2830,7 @@ class Linkedin(object):
                         },
                         "renderContentUnions": [],
                         "conversationUrn": full_conversation_urn,
-                        "originToken": str(uuid.uuid4())
+                        "originToken": _generate_uuid()
                     },
                     "mailboxUrn": full_sender_urn,
                     "trackingId": generate_trackingId_as_charString(),
@@ -2084,7 +2847,7 @@ class Linkedin(object):
                             "text": message_body
                         },
                         "renderContentUnions": [],
-                        "originToken": str(uuid.uuid4())
+                        "originToken": _generate_uuid()
                     },
                     "hostRecipientUrns": [full_recipient_urn],
                     "mailboxUrn": full_sender_urn,
@@ -2095,7 +2858,7 @@ class Linkedin(object):
             res = self._post(
                 "/voyagerMessagingDashMessengerMessages",
                 params={"action": "createMessage"},
-                data=json.dumps(payload),
+                data=_json_dumps(payload),
                 headers=headers
             )
 
@@ -2107,7 +2870,7 @@ class Linkedin(object):
                 # Response contains: { "value": { "conversationUrn": "urn:li:msg_conversation:(...)", ... } }
                 if not existing_conversation_id:
                     try:
-                        response_data = res.json()
+                        response_data = _json_loads(res.content)
                         conversation_urn = response_data.get("value", {}).get("conversationUrn")
                         if conversation_urn:
                             # Extract just the conversation ID from the full URN
@@ -2154,7 +2917,7 @@ class Linkedin(object):
         res = self._post(
             "/voyagerVideoDashMediaUploadMetadata",
             params={"action": "upload"},
-            data=json.dumps(payload),
+            data=_json_dumps(payload),
             headers=headers
         )
         
@@ -2165,7 +2928,7 @@ class Linkedin(object):
         elif res.status_code != 200:
             return {"status": res.status_code, "message": f"LinkedIn API error: {res.status_code}"}
         
-        data = res.json()
+        data = _json_loads(res.content)
         value = data.get("data", {}).get("value", {})
         
         return {
@@ -2268,7 +3031,7 @@ class Linkedin(object):
                 "byteSize": file_size,
                 "mediaType": mime_type,
                 "name": file_name,
-                "url": f"blob:https://www.linkedin.com/{str(uuid.uuid4())}"
+                "url": f"blob:https://www.linkedin.com/{_generate_uuid()}"
             }
         }
 
@@ -2308,7 +3071,7 @@ class Linkedin(object):
                     },
                     "renderContentUnions": [attachment],
                     "conversationUrn": full_conversation_urn,
-                    "originToken": str(uuid.uuid4())
+                    "originToken": _generate_uuid()
                 },
                 "mailboxUrn": full_sender_urn,
                 "trackingId": generate_trackingId_as_charString(),
@@ -2325,7 +3088,7 @@ class Linkedin(object):
                         "text": message_body
                     },
                     "renderContentUnions": [attachment],
-                    "originToken": str(uuid.uuid4())
+                    "originToken": _generate_uuid()
                 },
                 "hostRecipientUrns": [full_recipient_urn],
                 "mailboxUrn": full_sender_urn,
@@ -2336,7 +3099,7 @@ class Linkedin(object):
         res = self._post(
             "/voyagerMessagingDashMessengerMessages",
             params={"action": "createMessage"},
-            data=json.dumps(payload),
+            data=_json_dumps(payload),
             headers=headers
         )
 
@@ -2344,7 +3107,7 @@ class Linkedin(object):
             return 429
         
         if res.status_code == 200:
-            response_data = res.json()
+            response_data = _json_loads(res.content)
             return {
                 "success": True,
                 "message_urn": response_data.get("value", {}).get("entityUrn"),
@@ -2362,7 +3125,7 @@ class Linkedin(object):
         :return: Error state. If True, an error occured.
         :rtype: boolean
         """
-        payload = json.dumps({"patch": {"$set": {"read": True}}})
+        payload = _json_dumps({"patch": {"$set": {"read": True}}})
 
         res = self._post(
             f"/messaging/conversations/{conversation_urn_id}", data=payload
@@ -2391,7 +3154,7 @@ class Linkedin(object):
             except Exception as err:
                 return {"error": str(err), "message": "Network or connection error"}
             
-            me_profile = res.json()
+            me_profile = _json_loads(res.content)
             # cache profile
             self.client.metadata["me"] = me_profile
 
@@ -2408,23 +3171,46 @@ class Linkedin(object):
         :return: List of invitation objects
         :rtype: list
         """
-        params = {
-            "start": start,
-            "count": limit,
-            "includeInsights": True,
-            "q": "receivedInvitation",
-        }
+        return list(islice(self.iter_invitations(start=start, page_size=limit), limit))
 
-        res = self._fetch(
-            "/relationships/invitationViews",
-            params=params,
-        )
+    def iter_invitations(self, start=0, page_size=3):
+        """Lazily iterate over connection invitations for the currently logged
+        in user.
 
-        if res.status_code != 200:
-            return []
+        Pages of `page_size` invitations are only fetched as the caller
+        consumes them, so stopping early avoids requesting the remaining pages.
+
+        :param start: How much to offset results by
+        :type start: int
+        :param page_size: Amount of invitations to request per page
+        :type page_size: int
+
+        :return: Generator of invitation objects
+        :rtype: generator
+        """
+        while True:
+            params = {
+                "start": start,
+                "count": page_size,
+                "includeInsights": True,
+                "q": "receivedInvitation",
+            }
+
+            res = self._fetch(
+                "/relationships/invitationViews",
+                params=params,
+            )
+
+            if res.status_code != 200:
+                return
+
+            elements = _json_loads(res.content)["elements"]
+            for element in elements:
+                yield element["invitation"]
 
-        response_payload = res.json()
-        return [element["invitation"] for element in response_payload["elements"]]
+            if len(elements) < page_size:
+                return
+            start += len(elements)
 
     def reply_invitation(
         self, invitation_entity_urn, invitation_shared_secret, action="accept"
@@ -2443,7 +3229,7 @@ class Linkedin(object):
         """
         invitation_id = get_id_from_urn(invitation_entity_urn)
         params = {"action": action}
-        payload = json.dumps(
+        payload = _json_dumps(
             {
                 "invitationId": invitation_id,
                 "invitationSharedSecret": invitation_shared_secret,
@@ -2459,6 +3245,23 @@ class Linkedin(object):
 
         return res.status_code == 200
 
+    def reply_invitations_bulk(self, invitations, action="accept"):
+        """Respond to several connection invitations, using up to `max_workers`
+        concurrent requests. By default, accept the invitations.
+
+        :param invitations: (invitation entity URN, shared secret) pairs
+        :type invitations: list
+        :param action: "accept" or "reject". Defaults to "accept"
+        :type action: str, optional
+
+        :return: Success state of each invitation, in the same order as `invitations`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda invitation: self.reply_invitation(*invitation, action=action),
+            invitations,
+        )
+
     def add_connection(self, profile_public_id: str, message="", profile_urn=None):
         """Add a given profile id as a connection.
 
@@ -2491,42 +3294,37 @@ class Linkedin(object):
             },
             "customMessage": message,
         }
-        params = {
-            "action": "verifyQuotaAndCreateV2",
-            "decorationId": "com.linkedin.voyager.dash.deco.relationships.InvitationCreationResultWithInvitee-2",
-        }
-
         res = self._post(
             "/voyagerRelationshipsDashMemberRelationships",
-            data=json.dumps(payload),
+            data=_json_dumps(payload),
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
-            params=params,
+            params=_ADD_CONNECTION_PARAMS,
         )
-        print('status code:', res.status_code)
+        self.logger.debug("status code: %s", res.status_code)
 
         if res.status_code == 429:
             # Log headers + body so we can tell a real LinkedIn weekly-quota
             # 429 apart from a transient proxy-level 429. The caller applies a
             # Sunday-long restriction on 429, which is expensive to get wrong.
             try:
-                print(f'429 response headers: {dict(res.headers)}')
-                print(f'429 response body: {res.text[:1000]}')
+                self.logger.warning("429 response headers: %s", dict(res.headers))
+                self.logger.warning("429 response body: %s", res.text[:1000])
             except Exception as log_error:
-                print(f'429 logging failed: {log_error}')
+                self.logger.warning("429 logging failed: %s", log_error)
             return 429
         
         # 406 means already sent request - treat same as 400 INVITATION_ALREADY_SENT
         if res.status_code == 406:
-            print('406 - invitation already sent')
+            self.logger.debug("406 - invitation already sent")
             return 'INVITATION_ALREADY_SENT'
         
         # Check for 400 with specific error codes indicating invitation already sent
         if res.status_code == 400:
             try:
-                error_data = res.json()
+                error_data = _json_loads(res.content)
                 # LinkedIn returns error codes like CANT_RESEND_YET, ALREADY_INVITED, etc.
                 error_code = error_data.get('code') or error_data.get('data', {}).get('code')
-                print(f'400 error code: {error_code}, full response: {error_data}')
+                self.logger.debug("400 error code: %s, full response: %s", error_code, error_data)
                 if error_code in ['CANT_RESEND_YET', 'ALREADY_INVITED', 'INVITATION_PENDING']:
                     return 'INVITATION_ALREADY_SENT'
                 # Check for message patterns if code not found
@@ -2534,7 +3332,7 @@ class Linkedin(object):
                 if 'already' in error_message or 'pending' in error_message or 'resend' in error_message:
                     return 'INVITATION_ALREADY_SENT'
             except Exception as e:
-                print(f'Error parsing 400 response: {e}')
+                self.logger.warning("Error parsing 400 response: %s", e)
             return True
             
         if res.ok:
@@ -2542,6 +3340,26 @@ class Linkedin(object):
         else:
             return True
 
+    def add_connections_bulk(self, profile_urns, message=""):
+        """Send connection requests to several profiles, using up to
+        `max_workers` concurrent requests.
+
+        :param profile_urns: member URNs of LinkedIn profiles
+        :type profile_urns: list
+        :param message: message to send along with each connection request
+        :type message: str, optional
+
+        :return: Error state of each request (see `add_connection`), in the
+            same order as `profile_urns`
+        :rtype: list
+        """
+        return self._map_concurrently(
+            lambda profile_urn: self.add_connection(
+                None, message=message, profile_urn=profile_urn
+            ),
+            profile_urns,
+        )
+
     def remove_connection(self, public_profile_id):
         """Remove a given profile as a connection.
 
@@ -2567,7 +3385,7 @@ class Linkedin(object):
                 "accept": "*/*",
                 "content-type": "text/plain;charset=UTF-8",
             },
-            data=json.dumps(payload),
+            data=_json_dumps(payload),
         )
 
         return res.status_code != 200
@@ -2581,20 +3399,21 @@ class Linkedin(object):
         """View a profile, notifying the user that you "viewed" their profile.
 
         Provide [target_profile_member_urn_id] and [network_distance] to save 2 network requests and
-        speed up the execution of this function.
+        speed up the execution of this function. The current user profile and
+        network info are cached, so once both are known only the tracking
+        request is sent.
 
         :param target_profile_public_id: public ID of a LinkedIn profile
         :type target_profile_public_id: str
-        :param network_distance: How many degrees of separation exist e.g. 2
-        :type network_distance: int, optional
+        :param network_distance: How many degrees of separation exist e.g. 2,
+            or the "DISTANCE_2" form returned by `search_people`
+        :type network_distance: int or str, optional
         :param target_profile_member_urn_id: member URN id for target profile
         :type target_profile_member_urn_id: str, optional
 
         :return: Error state. True if error occurred
         :rtype: boolean
         """
-        me_profile = self.get_user_profile()
-
         if not target_profile_member_urn_id:
             # target_profile_member_urn_id is required - cannot be derived from public_id alone
             raise ValueError(
@@ -2602,14 +3421,17 @@ class Linkedin(object):
                 f"Use search_people() or get_profile_network_info() to find the URN for public_id: {target_profile_public_id}"
             )
 
+        me_profile = self.get_user_profile()
+
+        if isinstance(network_distance, str):
+            network_distance = _parse_network_distance(network_distance)
+
         if not network_distance:
             profile_network_info = self.get_profile_network_info(
                 public_profile_id=target_profile_public_id
             )
-            network_distance = int(
-                profile_network_info["distance"]
-                .get("value", "DISTANCE_2")
-                .split("_")[1]
+            network_distance = _parse_network_distance(
+                profile_network_info["distance"].get("value", "DISTANCE_2")
             )
 
         viewer_privacy_setting = "F"
@@ -2662,6 +3484,10 @@ class Linkedin(object):
         :return: Privacy settings data
         :rtype: dict
         """
+        cached = self._profile_cache.get(("privacySettings", public_profile_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         res = self._fetch(
             f"/identity/profiles/{public_profile_id}/privacySettings",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
@@ -2669,8 +3495,9 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
-        return data.get("data", {})
+        data = _json_loads(res.content).get("data", {})
+        self._profile_cache.set(("privacySettings", public_profile_id), copy.deepcopy(data))
+        return data
 
     def get_profile_member_badges(self, public_profile_id):
         """Fetch badges for a given LinkedIn profile.
@@ -2681,6 +3508,10 @@ class Linkedin(object):
         :return: Badges data
         :rtype: dict
         """
+        cached = self._profile_cache.get(("memberBadges", public_profile_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         res = self._fetch(
             f"/identity/profiles/{public_profile_id}/memberBadges",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
@@ -2688,8 +3519,9 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
-        return data.get("data", {})
+        data = _json_loads(res.content).get("data", {})
+        self._profile_cache.set(("memberBadges", public_profile_id), copy.deepcopy(data))
+        return data
 
     def get_profile_network_info(self, public_profile_id):
         """DEPRECATED - Fetch network information for a given LinkedIn profile.
@@ -2700,6 +3532,10 @@ class Linkedin(object):
         :return: Network data
         :rtype: dict
         """
+        cached = self._profile_cache.get(("networkinfo", public_profile_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         res = self._fetch(
             f"/identity/profiles/{public_profile_id}/networkinfo",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
@@ -2707,8 +3543,9 @@ class Linkedin(object):
         if res.status_code != 200:
             return {}
 
-        data = res.json()
-        return data.get("data", {})
+        data = _json_loads(res.content).get("data", {})
+        self._profile_cache.set(("networkinfo", public_profile_id), copy.deepcopy(data))
+        return data
 
     def unfollow_entity(self, urn_id):
         """Unfollow a given entity.
@@ -2723,7 +3560,7 @@ class Linkedin(object):
         res = self._post(
             "/feed/follows?action=unfollowByEntityUrn",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
-            data=json.dumps(payload),
+            data=_json_dumps(payload),
         )
 
         err = False
@@ -2732,6 +3569,41 @@ class Linkedin(object):
 
         return err
 
+    def _fetch_feed_posts_page(self, start, count):
+        """Fetch a single page of `/feed/updatesV2`.
+
+        :return: Posts parsed from the page's `included` array, and the page's
+            post URNs
+        :rtype: (list, list)
+        """
+        params = {
+            "count": str(count),
+            "q": "chronFeed",
+            "start": start,
+        }
+        res = self._fetch(
+            f"/feed/updatesV2",
+            params=params,
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            stream=True,
+        )
+        """
+        Response includes two keya:
+        - ['Data']['*elements']. It includes the posts URNs always
+        properly sorted as 'Recent', including yet sponsored posts. The
+        downside is that fetching one by one the posts is slower. We will
+        save the URNs to later on build a sorted list of posts purging
+        promotions
+        - ['included']. List with all the posts attributes, but not sorted as
+        'Recent' and including promoted posts
+        """
+        data = _json_loads(_read_body(res))
+        l_raw_posts = data.get("included", [])
+        l_raw_urns = data.get("data", {}).get("*elements", [])
+
+        l_new_posts = parse_list_raw_posts(l_raw_posts, self.client.LINKEDIN_BASE_URL)
+        return l_new_posts, parse_list_raw_urns(l_raw_urns)
+
     def _get_list_feed_posts_and_list_feed_urns(
         self, limit=-1, offset=0, exclude_promoted_posts=True
     ):
@@ -2752,60 +3624,56 @@ class Linkedin(object):
         _PROFILE_URL = f"{self.client.LINKEDIN_BASE_URL}/in/"
 
         l_posts = []
-        l_urns = []
 
         # If count>100 API will return HTTP 400
         count = Linkedin._MAX_UPDATE_COUNT
         if limit == -1:
             limit = Linkedin._MAX_UPDATE_COUNT
 
+        max_urns = min(limit, count * Linkedin._MAX_REPEATED_REQUESTS)
+
         # 'l_urns' equivalent to other functions 'results' variable
         l_urns = []
-
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(l_urns) < count:
-                count = limit - len(l_urns)
-            params = {
-                "count": str(count),
-                "q": "chronFeed",
-                "start": len(l_urns) + offset,
-            }
-            res = self._fetch(
-                f"/feed/updatesV2",
-                params=params,
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        # A post can show up on two pages when the feed shifts while paging;
+        # only its first occurrence is kept. Paging still advances by the
+        # number of URNs received (`fetched`), duplicates included
+        seen_urns = set()
+        fetched = 0
+
+        # When `max_workers` is greater than 1, that many pages are fetched at
+        # once; pages after a short one are discarded, and the next batch
+        # starts from the URNs gathered so far
+        exhausted = False
+        while not exhausted and fetched < max_urns:
+            starts = range(
+                fetched, min(max_urns, fetched + self.max_workers * count), count
             )
-            """
-            Response includes two keya:
-            - ['Data']['*elements']. It includes the posts URNs always
-            properly sorted as 'Recent', including yet sponsored posts. The
-            downside is that fetching one by one the posts is slower. We will
-            save the URNs to later on build a sorted list of posts purging
-            promotions
-            - ['included']. List with all the posts attributes, but not sorted as
-            'Recent' and including promoted posts
-            """
-            l_raw_posts = res.json().get("included", {})
-            l_raw_urns = res.json().get("data", {}).get("*elements", [])
-
-            l_new_posts = parse_list_raw_posts(
-                l_raw_posts, self.client.LINKEDIN_BASE_URL
+            # when we're close to the limit, only fetch what we need to
+            pages = self._map_concurrently(
+                lambda start: self._fetch_feed_posts_page(
+                    start + offset, min(count, limit - start)
+                ),
+                starts,
             )
-            l_posts.extend(l_new_posts)
-
-            l_urns.extend(parse_list_raw_urns(l_raw_urns))
+            for start, (l_new_posts, l_new_urns) in zip(starts, pages):
+                l_posts.extend(l_new_posts)
+                fetched += len(l_new_urns)
+                l_new_urns_unseen = [
+                    urn
+                    for urn in l_new_urns
+                    if not (urn in seen_urns or seen_urns.add(urn))
+                ]
+                l_urns.extend(l_new_urns_unseen)
 
-            # break the loop if we're done searching
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
-            if (
-                (limit > -1 and len(l_urns) >= limit)  # if our results exceed set limit
-                or len(l_urns) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(l_raw_urns) == 0:
-                break
+                # NOTE: we could also check for the `total` returned in the response.
+                # This is in data["data"]["paging"]["total"]
+                if not l_new_urns:
+                    exhausted = True
+                    break
+                if len(l_new_urns) < min(count, limit - start):
+                    break
 
-            self.logger.debug(f"results grew to {len(l_urns)}")
+            self.logger.debug("results grew to %d", len(l_urns))
 
         return l_posts, l_urns
 
@@ -2952,30 +3820,16 @@ class Linkedin(object):
                 self.logger.error(f"Error occurred during keyphrase search: {err}")
                 return {"error": str(err), "message": "Network or connection error"}
             
-            data = res.json()
+            data = _json_loads(res.content)
             data_clusters = data.get("data", {}).get("searchDashClustersByAll", {})
             
             if not data_clusters:
                 break
             
-            if data_clusters.get("_type") != "com.linkedin.restli.common.CollectionResponse":
+            if data_clusters.get("_type") != _COLLECTION_RESPONSE_TYPE:
                 break
             
-            # Extract results from clusters
-            new_elements = []
-            for cluster in data_clusters.get("elements", []):
-                if cluster.get("_type") != "com.linkedin.voyager.dash.search.SearchClusterViewModel":
-                    continue
-                
-                for item in cluster.get("items", []):
-                    if item.get("_type") != "com.linkedin.voyager.dash.search.SearchItem":
-                        continue
-                    
-                    # Get the entityResult - it's embedded directly in the response
-                    entity_result = item.get("item", {}).get("entityResult")
-                    
-                    if entity_result and entity_result.get("_type") == "com.linkedin.voyager.dash.search.EntityResultViewModel":
-                        new_elements.append(entity_result)
+            new_elements = list(_iter_entity_results(data_clusters))
             
             if not new_elements:
                 break
@@ -2984,7 +3838,7 @@ class Linkedin(object):
             
             # Check if we've reached the limit
             if limit > -1 and len(results) >= limit:
-                results = results[:limit]
+                del results[limit:]
                 break
             
             # Move to next page
@@ -2995,29 +3849,40 @@ class Linkedin(object):
                 self.logger.warning("Reached maximum request limit")
                 break
             
-            self.logger.debug(f"Keyphrase search results grew to {len(results)}")
+            self.logger.debug("Keyphrase search results grew to %d", len(results))
             self._evade()
         
         return results
 
-    def get_job(self, job_id):
+    def get_job(self, job_id, use_cache=True):
         """Fetch data about a given job.
         :param job_id: LinkedIn job ID
         :type job_id: str
+        :param use_cache: Return a result cached by an earlier call, if any
+        :type use_cache: bool, optional
 
         :return: Job data
         :rtype: dict
         """
-        params = {
-            "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
-        }
+        if use_cache:
+            cached = self._lookup_cache.get(("job", job_id))
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        res = self._fetch(f"/jobs/jobPostings/{job_id}", params=_JOB_POSTING_PARAMS)
 
-        res = self._fetch(f"/jobs/jobPostings/{job_id}", params=params)
+        if res.status_code != 200:
+            # only the error message is read from the error envelope
+            self.logger.info(
+                "request failed: %s", _json_project(res.content, ("message",))
+            )
+            return {}
 
-        data = res.json()
+        data = _json_loads(res.content)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
             return {}
 
+        self._lookup_cache.set(("job", job_id), copy.deepcopy(data))
         return data
@@ -34,17 +34,34 @@ def parse_education_response(response_data: dict) -> List[dict]:
     if not paged_list:
         return education_list
     
+    # Index included entities once for the per-item school lookups
+    included_by_urn = _index_by_urn(included)
+    
     # Extract education elements
     elements = paged_list.get('components', {}).get('elements', [])
     
     for element in elements:
-        edu = _extract_education_item(element, included)
+        edu = _extract_education_item(element, included_by_urn)
         if edu:
             education_list.append(edu)
     
     return education_list
 
 
+def _index_by_urn(included: List[dict]) -> Dict[str, dict]:
+    """
+    Map entityUrn to entity for the included array.
+    
+    If several entities share a URN, the first one wins.
+    """
+    included_by_urn = {}
+    for item in included:
+        entity_urn = item.get('entityUrn')
+        if entity_urn:
+            included_by_urn.setdefault(entity_urn, item)
+    return included_by_urn
+
+
 def _find_paged_list_component(included: List[dict]) -> Optional[dict]:
     """Find PagedListComponent in included array."""
     for item in included:
@@ -53,13 +70,13 @@ def _find_paged_list_component(included: List[dict]) -> Optional[dict]:
     return None
 
 
-def _extract_education_item(element: dict, included: List[dict]) -> Optional[dict]:
+def _extract_education_item(element: dict, included_by_urn: Dict[str, dict]) -> Optional[dict]:
     """
     Extract single education item from element.
     
     Args:
         element: Component element containing education data
-        included: Included array for resolving school data
+        included_by_urn: Included entities by entityUrn, for resolving school data
         
     Returns:
         Dictionary with structured education data
@@ -89,7 +106,7 @@ def _extract_education_item(element: dict, included: List[dict]) -> Optional[dic
     start_year, end_year = parse_education_date_range(date_range)
     
     # Find school logo in included array
-    school_logo = _find_school_logo(school_id, included)
+    school_logo = _find_school_logo(school_id, included_by_urn)
     
     return {
         'school': school_name,
@@ -209,13 +226,13 @@ def _find_text_component(component: dict) -> Optional[dict]:
     return None
 
 
-def _find_school_logo(school_id: Optional[str], included: List[dict]) -> Optional[str]:
+def _find_school_logo(school_id: Optional[str], included_by_urn: Dict[str, dict]) -> Optional[str]:
     """
     Find school logo in included array.
     
     Args:
         school_id: School ID to search for
-        included: Included array from response
+        included_by_urn: Included entities by entityUrn
         
     Returns:
         School logo URL or None
@@ -224,29 +241,28 @@ def _find_school_logo(school_id: Optional[str], included: List[dict]) -> Optiona
         return None
     
     school_urn = f"urn:li:fsd_school:{school_id}"
+    item = included_by_urn.get(school_urn)
+    if item is None:
+        return None
     
-    for item in included:
-        if item.get('entityUrn') == school_urn:
-            # Extract logo
-            logo_result = item.get('logoResolutionResult', {})
-            vector_image = logo_result.get('vectorImage', {})
-            root_url = vector_image.get('rootUrl', '')
-            artifacts = vector_image.get('artifacts', [])
-            
-            # Get 200x200 logo (preferred size)
-            school_logo = None
-            for artifact in artifacts:
-                if artifact.get('width') == 200:
-                    school_logo = root_url + artifact.get('fileIdentifyingUrlPathSegment', '')
-                    break
-            
-            # Fallback to first available size
-            if not school_logo and artifacts:
-                school_logo = root_url + artifacts[0].get('fileIdentifyingUrlPathSegment', '')
-            
-            return school_logo
+    # Extract logo
+    logo_result = item.get('logoResolutionResult', {})
+    vector_image = logo_result.get('vectorImage', {})
+    root_url = vector_image.get('rootUrl', '')
+    artifacts = vector_image.get('artifacts', [])
     
-    return None
+    # Get 200x200 logo (preferred size)
+    school_logo = None
+    for artifact in artifacts:
+        if artifact.get('width') == 200:
+            school_logo = root_url + artifact.get('fileIdentifyingUrlPathSegment', '')
+            break
+    
+    # Fallback to first available size
+    if not school_logo and artifacts:
+        school_logo = root_url + artifacts[0].get('fileIdentifyingUrlPathSegment', '')
+    
+    return school_logo
 
 
 def parse_education_date_range(date_text: str) -> Tuple[Optional[int], Optional[int]]:
@@ -35,6 +35,9 @@ def parse_experience_response(response_data: dict) -> List[dict]:
     if not paged_list:
         return experiences
     
+    # Index included entities once for the per-item company/group lookups
+    included_by_urn = _index_by_urn(included)
+    
     # Extract experience elements
     elements = paged_list.get('components', {}).get('elements', [])
     
@@ -42,17 +45,31 @@ def parse_experience_response(response_data: dict) -> List[dict]:
         # Check if this is a position group (multiple roles at same company)
         if _is_position_group(element):
             # Expand the position group into individual positions
-            group_positions = _extract_position_group(element, included)
+            group_positions = _extract_position_group(element, included_by_urn)
             experiences.extend(group_positions)
         else:
             # Regular single position
-            exp = _extract_experience_item(element, included)
+            exp = _extract_experience_item(element, included_by_urn)
             if exp:
                 experiences.append(exp)
     
     return experiences
 
 
+def _index_by_urn(included: List[dict]) -> Dict[str, dict]:
+    """
+    Map entityUrn to entity for the included array.
+    
+    If several entities share a URN, the first one wins.
+    """
+    included_by_urn = {}
+    for item in included:
+        entity_urn = item.get('entityUrn')
+        if entity_urn:
+            included_by_urn.setdefault(entity_urn, item)
+    return included_by_urn
+
+
 def _is_position_group(element: dict) -> bool:
     """
     Check if an element is a position group (multiple roles at same company).
@@ -75,7 +92,7 @@ def _is_position_group(element: dict) -> bool:
     return False
 
 
-def _extract_position_group(element: dict, included: List[dict]) -> List[dict]:
+def _extract_position_group(element: dict, included_by_urn: Dict[str, dict]) -> List[dict]:
     """
     Extract all positions from a position group.
     
@@ -104,19 +121,14 @@ def _extract_position_group(element: dict, included: List[dict]) -> List[dict]:
         return positions
     
     # Find the nested PagedListComponent in included array
-    nested_paged_list = None
-    for item in included:
-        if item.get('entityUrn') == nested_paged_list_urn:
-            nested_paged_list = item
-            break
-    
+    nested_paged_list = included_by_urn.get(nested_paged_list_urn)
     if not nested_paged_list:
         return positions
     
     # Extract positions from nested list
     nested_elements = nested_paged_list.get('components', {}).get('elements', [])
     for nested_element in nested_elements:
-        pos = _extract_experience_item(nested_element, included)
+        pos = _extract_experience_item(nested_element, included_by_urn)
         if pos:
             positions.append(pos)
     
@@ -151,13 +163,13 @@ def _find_paged_list_component(included: List[dict]) -> Optional[dict]:
     return max(paged_lists, key=lambda x: (x['elements_count'], x['total']))['component']
 
 
-def _extract_experience_item(element: dict, included: List[dict]) -> Optional[dict]:
+def _extract_experience_item(element: dict, included_by_urn: Dict[str, dict]) -> Optional[dict]:
     """
     Extract single experience item from element.
     
     Args:
         element: Component element containing experience data
-        included: Included array for resolving company data
+        included_by_urn: Included entities by entityUrn, for resolving company data
         
     Returns:
         Dictionary with structured experience data
@@ -187,7 +199,7 @@ def _extract_experience_item(element: dict, included: List[dict]) -> Optional[di
     start_date, end_date, is_current = parse_date_range(date_range)
     
     # Find company data in included array
-    company_name, company_logo = _find_company_data(company_id, included)
+    company_name, company_logo = _find_company_data(company_id, included_by_urn)
     
     # Use subtitle as company name if not found
     if not company_name and subtitle:
@@ -440,13 +452,13 @@ def _find_text_component(component: dict) -> Optional[dict]:
     return None
 
 
-def _find_company_data(company_id: Optional[str], included: List[dict]) -> Tuple[Optional[str], Optional[str]]:
+def _find_company_data(company_id: Optional[str], included_by_urn: Dict[str, dict]) -> Tuple[Optional[str], Optional[str]]:
     """
     Find company name and logo in included array.
     
     Args:
         company_id: Company ID to search for
-        included: Included array from response
+        included_by_urn: Included entities by entityUrn
         
     Returns:
         Tuple of (company_name, company_logo_url)
@@ -455,35 +467,34 @@ def _find_company_data(company_id: Optional[str], included: List[dict]) -> Tuple
         return None, None
     
     company_urn = f"urn:li:fsd_company:{company_id}"
+    item = included_by_urn.get(company_urn)
+    if item is None:
+        return None, None
     
-    for item in included:
-        if item.get('entityUrn') == company_urn:
-            # Extract company name (if available)
-            company_name = item.get('name')  # May not be present
-            
-            # Extract logo (safely handle None values)
-            logo_result = item.get('logoResolutionResult')
-            company_logo = None
+    # Extract company name (if available)
+    company_name = item.get('name')  # May not be present
+    
+    # Extract logo (safely handle None values)
+    logo_result = item.get('logoResolutionResult')
+    company_logo = None
+    
+    if logo_result and isinstance(logo_result, dict):
+        vector_image = logo_result.get('vectorImage', {})
+        if vector_image and isinstance(vector_image, dict):
+            root_url = vector_image.get('rootUrl', '')
+            artifacts = vector_image.get('artifacts', [])
             
-            if logo_result and isinstance(logo_result, dict):
-                vector_image = logo_result.get('vectorImage', {})
-                if vector_image and isinstance(vector_image, dict):
-                    root_url = vector_image.get('rootUrl', '')
-                    artifacts = vector_image.get('artifacts', [])
-                    
-                    # Get 200x200 logo (preferred size)
-                    for artifact in artifacts:
-                        if artifact.get('width') == 200:
-                            company_logo = root_url + artifact.get('fileIdentifyingUrlPathSegment', '')
-                            break
-                    
-                    # Fallback to first available size
-                    if not company_logo and artifacts:
-                        company_logo = root_url + artifacts[0].get('fileIdentifyingUrlPathSegment', '')
+            # Get 200x200 logo (preferred size)
+            for artifact in artifacts:
+                if artifact.get('width') == 200:
+                    company_logo = root_url + artifact.get('fileIdentifyingUrlPathSegment', '')
+                    break
             
-            return company_name, company_logo
+            # Fallback to first available size
+            if not company_logo and artifacts:
+                company_logo = root_url + artifacts[0].get('fileIdentifyingUrlPathSegment', '')
     
-    return None, None
+    return company_name, company_logo
 
 
 def parse_date_range(date_text: str) -> Tuple[Optional[str], Optional[str], bool]:
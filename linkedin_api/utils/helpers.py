@@ -1,4 +1,4 @@
-import random
+import os
 import base64
 
 
@@ -165,10 +165,7 @@ def parse_list_raw_urns(l_raw_urns):
     :return: List of URNs
     :rtype: list
     """
-    l_urns = []
-    for i in l_raw_urns:
-        l_urns.append(get_urn_from_raw_update(i))
-    return l_urns
+    return [get_urn_from_raw_update(i) for i in l_raw_urns]
 
 
 def parse_list_raw_posts(l_raw_posts, linkedin_base_url):
@@ -183,40 +180,34 @@ def parse_list_raw_posts(l_raw_posts, linkedin_base_url):
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
+    # Same merging as append_update_post_field_to_posts_list, keeping the
+    # post being filled in a local instead of calling it for every field
     l_posts = []
+    post = None
     for i in l_raw_posts:
-        author_name = get_update_author_name(i)
-        if author_name:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_name", author_name
-            )
-
-        author_profile = get_update_author_profile(i, linkedin_base_url)
-        if author_profile:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_profile", author_profile
-            )
-
-        old = get_update_old(i)
-        if old:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "old", old)
-
-        content = get_update_content(i, linkedin_base_url)
-        if content:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "content", content
-            )
-
-        url = get_update_url(i, linkedin_base_url)
-        if url:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "url", url)
+        fields = (
+            ("author_name", get_update_author_name(i)),
+            ("author_profile", get_update_author_profile(i, linkedin_base_url)),
+            ("old", get_update_old(i)),
+            ("content", get_update_content(i, linkedin_base_url)),
+            ("url", get_update_url(i, linkedin_base_url)),
+        )
+        for post_key, post_value in fields:
+            if not post_value:
+                continue
+            if post is None or post_key in post:
+                post = {post_key: post_value}
+                l_posts.append(post)
+            else:
+                post[post_key] = post_value
 
     return l_posts
 
 
 def get_list_posts_sorted_without_promoted(l_urns, l_posts):
     """Iterates l_urns and looks for corresponding dicts in l_posts matching 'url' key.
-    If found, removes this dict from l_posts and appends it to the returned list of posts
+    If found, appends this dict to the returned list of posts. Each post is
+    returned at most once.
 
     :param l_urns: List of posts URNs
     :type l_urns: list
@@ -226,15 +217,14 @@ def get_list_posts_sorted_without_promoted(l_urns, l_posts):
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts_sorted_without_promoted = []
-    l_posts[:] = [d for d in l_posts if "Promoted" not in d.get("old")]
-    for urn in l_urns:
-        for post in l_posts:
-            if urn in post["url"]:
-                l_posts_sorted_without_promoted.append(post)
-                l_posts[:] = [d for d in l_posts if urn not in d.get("url")]
-                break
-    return l_posts_sorted_without_promoted
+    # post URLs end with the post URN (see get_update_url), so index the posts
+    # by it once instead of scanning every post for every URN
+    posts_by_urn = {}
+    for post in l_posts:
+        if "Promoted" in post.get("old"):
+            continue
+        posts_by_urn.setdefault(post["url"].rpartition("/feed/update/")[2], post)
+    return [posts_by_urn.pop(urn) for urn in l_urns if urn in posts_by_urn]
 
 
 def generate_trackingId_as_charString():
@@ -243,9 +233,7 @@ def generate_trackingId_as_charString():
     :return: Random trackingId string
     :rtype: str
     """
-    random_int_array = [random.randrange(256) for _ in range(16)]
-    rand_byte_array = bytearray(random_int_array)
-    return "".join([chr(i) for i in rand_byte_array])
+    return os.urandom(16).decode("latin-1")
 
 
 def generate_trackingId():
@@ -254,9 +242,7 @@ def generate_trackingId():
     :return: Random trackingId string
     :rtype: str
     """
-    random_int_array = [random.randrange(256) for _ in range(16)]
-    rand_byte_array = bytearray(random_int_array)
-    return str(base64.b64encode(rand_byte_array))[2:-1]
+    return base64.b64encode(os.urandom(16)).decode("ascii")
 
 # Function to safely navigate nested dictionaries
 def get_nested(data_dict, keys, default=None):
@@ -265,12 +251,18 @@ def get_nested(data_dict, keys, default=None):
     
     :param data_dict: The dictionary to traverse.
     :param keys: A list of keys representing the path to the desired value.
+        Integer keys index into lists.
     :param default: The default value to return if any key is missing.
     :return: The retrieved value or the default.
     """
     for key in keys:
         if isinstance(data_dict, dict):
             data_dict = data_dict.get(key, default)
+        elif isinstance(data_dict, list) and isinstance(key, int):
+            try:
+                data_dict = data_dict[key]
+            except IndexError:
+                return default
         else:
             return default
         if data_dict is default:
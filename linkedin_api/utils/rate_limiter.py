@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiter for Linkedin requests.
+
+    Requests are paced by a token bucket that refills at `requests_per_minute`
+    and holds up to `burst` tokens, so after a quiet spell up to `burst`
+    requests go out without waiting. On top of that, no more than
+    `requests_per_minute` are sent in any sliding one-minute window. The
+    rate adapts to the responses
+    (AIMD): every successful response raises it by `increase`, and every 429
+    or 5xx response multiplies it by `decrease` and pauses further requests.
+    Rate-limit headers, when present, pause requests before the limit is hit.
+    """
+
+    WINDOW = 60.0  # seconds
+
+    def __init__(
+        self,
+        requests_per_minute=20,
+        min_requests_per_minute=2,
+        max_requests_per_minute=60,
+        increase=0.5,
+        decrease=0.5,
+        jitter=1.0,
+        burst=1,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.min_requests_per_minute = min_requests_per_minute
+        self.max_requests_per_minute = max_requests_per_minute
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+        self.burst = burst
+        # may go negative: requests that are waiting for a token borrow it
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._timestamps = deque()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait_if_throttled(self):
+        """
+        Block until another request may be sent, and reserve a slot for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            while self._timestamps and self._timestamps[0] <= now - self.WINDOW:
+                self._timestamps.popleft()
+
+            rate = self.requests_per_minute / self.WINDOW
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * rate
+            )
+            self._refilled_at = now
+
+            send_at = max(now, self._paused_until)
+            if self._tokens < 1:
+                send_at = max(send_at, now + (1 - self._tokens) / rate)
+            self._tokens -= 1
+            if len(self._timestamps) >= int(self.requests_per_minute):
+                send_at = max(send_at, self._timestamps[0] + self.WINDOW)
+            send_at += random.uniform(0, self.jitter)
+
+            self._timestamps.append(send_at)
+
+        delay = send_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response):
+        """
+        Adapt the request rate to a response received from Linkedin.
+        """
+        headers = response.headers
+        with self._lock:
+            now = time.monotonic()
+            if response.status_code == 429 or response.status_code >= 500:
+                self.requests_per_minute = max(
+                    self.min_requests_per_minute,
+                    self.requests_per_minute * self.decrease,
+                )
+                backoff = _parse_number(headers.get("retry-after"))
+                if backoff is None:
+                    backoff = self.WINDOW / self.requests_per_minute
+                self._paused_until = max(self._paused_until, now + backoff)
+            else:
+                self.requests_per_minute = min(
+                    self.max_requests_per_minute,
+                    self.requests_per_minute + self.increase,
+                )
+
+            remaining = _parse_number(headers.get("x-ratelimit-remaining-requests"))
+            limit = _parse_number(headers.get("x-ratelimit-limit-requests"))
+            if remaining is not None and limit and remaining < 0.1 * limit:
+                reset = _parse_number(headers.get("x-ratelimit-reset-requests"))
+                self._paused_until = max(
+                    self._paused_until,
+                    now + (reset if reset is not None else self.WINDOW),
+                )
+
+
+def _parse_number(value):
+    """
+    Return a numeric header value as a float, or None if it is missing or
+    not a plain number (e.g. an HTTP date in Retry-After).
+    """
+    if value is None:
+        return None
+    try:
+        return float(str(value).rstrip("s"))
+    except ValueError:
+        return None
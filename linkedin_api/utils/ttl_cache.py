@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache(object):
+    """
+    Bounded in-memory cache whose entries expire `ttl` seconds after being set.
+
+    When full, the least recently used entry is evicted. A `ttl` of 0 disables
+    the cache: `set` stores nothing and `get` always misses.
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for `key`, or `default` if missing or expired.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Cache `value` under `key`, evicting the least recently used entry if
+        the cache is full. A `ttl` shorter than the cache's own applies to
+        this entry only.
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
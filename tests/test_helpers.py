@@ -0,0 +1,65 @@
+from linkedin_api.utils.helpers import (
+    get_list_posts_sorted_without_promoted,
+    parse_list_raw_posts,
+    parse_list_raw_urns,
+)
+
+BASE_URL = "https://www.linkedin.com"
+
+
+def post(urn, old="1d"):
+    return {"old": old, "url": f"{BASE_URL}/feed/update/{urn}"}
+
+
+def test_parse_list_raw_posts_merges_fields_across_included_items():
+    raw_posts = [
+        {
+            "actor": {
+                "name": {"text": "Ada"},
+                "urn": "urn:li:member:1",
+                "subDescription": {"text": "2d"},
+            }
+        },
+        {
+            "commentary": {"text": {"text": "Hello"}},
+            "updateMetadata": {"urn": "urn:li:activity:1"},
+        },
+        {"actor": {"name": {"text": "Bob"}}},
+    ]
+
+    assert parse_list_raw_posts(raw_posts, BASE_URL) == [
+        {
+            "author_name": "Ada",
+            "author_profile": f"{BASE_URL}/in/1",
+            "old": "2d",
+            "content": "Hello",
+            "url": f"{BASE_URL}/feed/update/urn:li:activity:1",
+        },
+        {"author_name": "Bob"},
+    ]
+
+
+def test_parse_list_raw_urns():
+    raw_urns = [
+        "urn:li:fs_updateV2:(urn:li:activity:1,MAIN_FEED,EMPTY,DEFAULT,false)",
+        "urn:li:fs_updateV2:(urn:li:activity:2,MAIN_FEED,EMPTY,DEFAULT,false)",
+    ]
+    assert parse_list_raw_urns(raw_urns) == ["urn:li:activity:1", "urn:li:activity:2"]
+
+
+def test_sorted_posts_follow_urn_order():
+    posts = [post("urn:li:activity:1"), post("urn:li:activity:2")]
+    urns = ["urn:li:activity:2", "urn:li:activity:1", "urn:li:activity:3"]
+    assert get_list_posts_sorted_without_promoted(urns, posts) == posts[::-1]
+
+
+def test_sorted_posts_drop_promoted_posts():
+    posts = [post("urn:li:activity:1", old="Promoted"), post("urn:li:activity:2")]
+    urns = ["urn:li:activity:1", "urn:li:activity:2"]
+    assert get_list_posts_sorted_without_promoted(urns, posts) == [posts[1]]
+
+
+def test_sorted_posts_return_a_repeated_urn_once():
+    posts = [post("urn:li:activity:1"), post("urn:li:activity:1")]
+    urns = ["urn:li:activity:1", "urn:li:activity:1"]
+    assert get_list_posts_sorted_without_promoted(urns, posts) == [posts[0]]
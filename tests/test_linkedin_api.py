@@ -1,10 +1,409 @@
+import io
+import json
 import os
 import sys
+import threading
+import time
 import pytest
+import requests
+import urllib3
 
-from linkedin_api import Linkedin
+from linkedin_api import Linkedin, linkedin
+
+
+def mock_response(body, status_code=200):
+    res = requests.models.Response()
+    res.status_code = status_code
+    res._content = json.dumps(body).encode()
+    res.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(res._content), status=status_code, preload_content=False
+    )
+    return res
+
+
+def search_page(urns, total=None):
+    items = [
+        {
+            "_type": linkedin._SEARCH_ITEM_TYPE,
+            "item": {
+                "entityResult": {
+                    "_type": linkedin._ENTITY_RESULT_TYPE,
+                    "entityUrn": urn,
+                }
+            },
+        }
+        for urn in urns
+    ]
+    return {
+        "data": {
+            "searchDashClustersByAll": {
+                "_type": linkedin._COLLECTION_RESPONSE_TYPE,
+                "elements": [{"_type": linkedin._SEARCH_CLUSTER_TYPE, "items": items}],
+                "paging": {"count": len(urns), "total": total},
+            }
+        }
+    }
+
+
+def search_page_start(uri):
+    return int(uri[len(linkedin._SEARCH_URL_PREFIX) :].split(",", 1)[0])
 
 
 def test_constructor():
     api = Linkedin("test", "test", authenticate=False)
     assert api
+
+
+def test_encode_voyager_query_escapes_structural_characters():
+    query = {
+        "keywords": "C++, Python (remote)",
+        "selectedFilters": {"company": ["1", "2"], "distance": [25]},
+    }
+    assert linkedin._encode_voyager_query(query) == (
+        "(keywords:C%2B%2B%2C%20Python%20%28remote%29,"
+        "selectedFilters:(company:List(1,2),distance:List(25)))"
+    )
+
+
+def test_search_jobs_query_keeps_keywords_inside_the_tuple(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    uris = []
+
+    def fetch(uri, **kwargs):
+        uris.append(uri)
+        return mock_response({"included": [], "data": {"paging": {}}})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    api.search_jobs(keywords="C++, Python (remote)", location_name="Kyiv, Ukraine")
+
+    query = uris[0].split("&query=", 1)[1].split("&count=", 1)[0]
+    assert query.startswith(
+        "(origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,"
+        "keywords:C%2B%2B%2C%20Python%20%28remote%29,"
+        "locationFallback:Kyiv%2C%20Ukraine,"
+        "selectedFilters:(timePostedRange:List(r86400)),"
+    )
+
+
+def test_get_job_returns_copies_of_cached_results(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        return mock_response({"title": "Engineer", "skills": [{"name": "Python"}]})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    job = api.get_job("1")
+    job["title"] = "changed"
+    job["skills"][0]["name"] = "changed"
+    assert api.get_job("1") == {"title": "Engineer", "skills": [{"name": "Python"}]}
+    assert len(calls) == 1
+
+    api.get_job("1", use_cache=False)
+    assert len(calls) == 2
+
+
+def test_get_profile_caches_copies_under_one_key(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        return mock_response({"data": {"firstName": "Ada"}, "included": []})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    profile = api.get_profile(urn_id="ACoAA1")
+    profile["first_name"] = "changed"
+    profile = api.get_profile(urn_id="urn:li:fsd_profile:ACoAA1")
+    assert profile["first_name"] == "Ada"
+    assert len(calls) == 1
+
+
+def test_get_profile_contact_info_cache_keeps_nested_lists_intact(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        profile = {
+            "$type": linkedin._PROFILE_TYPE,
+            "websites": [{"url": "https://example.com", "category": "BLOG"}],
+        }
+        return mock_response({"data": {}, "included": [profile]})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    api.get_profile_contact_info("ada")["websites"].append({"url": "x"})
+    api.get_profile_contact_info("ada")["websites"][0]["url"] = "changed"
+    contact_info = api.get_profile_contact_info("ada")
+    assert contact_info["websites"] == [{"url": "https://example.com", "type": "BLOG"}]
+    assert len(calls) == 1
+
+
+def test_clear_profile_cache_forgets_every_profile_lookup(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        return mock_response({"data": {"badges": []}})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    api._profile_urn_cache.set("ada", "urn:li:fsd_profile:ACoAA1")
+    api.get_profile_member_badges("ada")
+    api.get_profile_network_info("ada")
+    api.get_profile_member_badges("ada")
+    assert len(calls) == 2
+
+    api.clear_profile_cache()
+    assert api._profile_urn_cache.get("ada") is None
+    api.get_profile_member_badges("ada")
+    assert len(calls) == 3
+
+
+def test_loads_with_included_types_matches_on_both_paths(monkeypatch):
+    pytest.importorskip("ijson")
+    body = {
+        "data": {"paging": {"total": 2}, "score": 0.5},
+        "included": [
+            {"$type": "keep", "entityUrn": "urn:1", "tags": [{"a": None}]},
+            {"$type": "drop", "entityUrn": "urn:2"},
+            {"$type": "keep", "entityUrn": "urn:3", "nested": {"x": [1, 2]}},
+        ],
+        "meta": {"microSchema": True},
+    }
+    full = linkedin._loads_with_included_types(mock_response(body), {"keep"})
+    monkeypatch.setattr(linkedin, "_STREAM_MIN_SIZE", -1)
+    streamed = linkedin._loads_with_included_types(mock_response(body), {"keep"})
+
+    assert streamed == full
+    assert list(full) == ["data", "included", "meta"]
+    assert [item["entityUrn"] for item in full["included"]] == ["urn:1", "urn:3"]
+
+
+def test_search_drops_repeats_and_stops_on_a_page_of_repeats(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    pages = {0: ["a", "b"], 2: ["b", "c"], 4: ["b", "c"], 6: ["d"]}
+    starts = []
+
+    def fetch(uri, **kwargs):
+        starts.append(search_page_start(uri))
+        return mock_response(search_page(pages[starts[-1]]))
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    results = api.search({"keywords": "python"})
+
+    assert [result["entityUrn"] for result in results] == ["a", "b", "c"]
+    assert starts == [0, 2, 4]
+
+
+def test_search_merges_concurrent_pages_in_order(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False, max_workers=3)
+    pages = {0: ["a", "b"], 2: ["c", "d"], 4: ["d", "e"]}
+
+    def fetch(uri, **kwargs):
+        start = search_page_start(uri)
+        if start == 2:
+            # finish after the page that follows it
+            time.sleep(0.05)
+        return mock_response(search_page(pages[start], total=6))
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    results = api.search({"keywords": "python"})
+
+    assert [result["entityUrn"] for result in results] == ["a", "b", "c", "d", "e"]
+
+
+def test_get_post_comments_drops_repeats_and_stops_on_a_page_of_repeats(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    pages = [
+        {"elements": [{"entityUrn": "c1"}, {"entityUrn": "c2"}], "token": "t1"},
+        {"elements": [{"entityUrn": "c2"}, {"entityUrn": "c3"}], "token": "t2"},
+        {"elements": [{"entityUrn": "c3"}], "token": "t3"},
+        {"elements": [{"entityUrn": "c4"}], "token": ""},
+    ]
+    calls = []
+
+    def fetch(uri, **kwargs):
+        page = pages[len(calls)]
+        calls.append(kwargs["params"].get("paginationToken"))
+        return mock_response(
+            {
+                "elements": page["elements"],
+                "metadata": {"paginationToken": page["token"]},
+            }
+        )
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    comments = api.get_post_comments("1")
+
+    assert [comment["entityUrn"] for comment in comments] == ["c1", "c2", "c3"]
+    assert calls == [None, "t1", "t2"]
+
+
+def test_feed_drops_urns_repeated_across_pages(monkeypatch):
+    monkeypatch.setattr(Linkedin, "_MAX_UPDATE_COUNT", 2)
+    api = Linkedin("test", "test", authenticate=False)
+    pages = {0: ["1", "2"], 2: ["2", "3"]}
+
+    def fetch(uri, **kwargs):
+        urns = [
+            f"urn:li:fs_updateV2:(urn:li:activity:{i},MAIN_FEED,EMPTY,DEFAULT,false)"
+            for i in pages[kwargs["params"]["start"]]
+        ]
+        return mock_response({"data": {"*elements": urns}, "included": []})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    _, urns = api._get_list_feed_posts_and_list_feed_urns(limit=4)
+
+    assert urns == ["urn:li:activity:1", "urn:li:activity:2", "urn:li:activity:3"]
+
+
+def typeahead_response():
+    return mock_response(
+        {"data": {"data": {"searchDashReusableTypeaheadByType": {"elements": []}}}}
+    )
+
+
+def wait_for_typeahead_waiter(monkeypatch):
+    """Return an Event set once a second caller blocks on the pending request."""
+    waiting = threading.Event()
+
+    class WatchedFuture(linkedin.Future):
+        def result(self, timeout=None):
+            waiting.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr(linkedin, "Future", WatchedFuture)
+    return waiting
+
+
+def test_concurrent_typeahead_calls_share_one_request(monkeypatch):
+    # caching disabled, so only coalescing can save the second request
+    api = Linkedin("test", "test", authenticate=False, cache_ttl=0)
+    waiting = wait_for_typeahead_waiter(monkeypatch)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        assert waiting.wait(5)
+        return typeahead_response()
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(api.search_typeahead("py", "GEO"))
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [[], []]
+    assert len(calls) == 1
+    assert not api._typeahead_pending
+
+
+def test_concurrent_typeahead_calls_share_an_exception(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False, cache_ttl=0)
+    waiting = wait_for_typeahead_waiter(monkeypatch)
+    errors = []
+
+    def fetch_typeahead(keywords, search_type):
+        assert waiting.wait(5)
+        raise RuntimeError("boom")
+
+    def call():
+        try:
+            api.search_typeahead("py", "GEO")
+        except RuntimeError as e:
+            errors.append(e)
+
+    monkeypatch.setattr(api, "_fetch_typeahead", fetch_typeahead)
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+    assert not api._typeahead_pending
+
+
+def test_parse_connections_matches_without_msgspec(monkeypatch):
+    pytest.importorskip("msgspec")
+    body = json.dumps(
+        {
+            "elements": [
+                {
+                    "connectedMemberResolutionResult": {
+                        "firstName": "Ada",
+                        "lastName": "Lovelace",
+                        "entityUrn": "urn:li:fsd_profile:1",
+                        "headline": "Analyst",
+                    }
+                },
+                {"connectedMemberResolutionResult": {"firstName": "Bob"}},
+                {},
+            ]
+        }
+    ).encode()
+
+    with_msgspec = linkedin._parse_connections(body)
+    monkeypatch.setattr(linkedin, "msgspec", None)
+    assert linkedin._parse_connections(body) == with_msgspec
+    assert with_msgspec[0] == {
+        "firstName": "Ada",
+        "lastName": "Lovelace",
+        "profileUrn": "urn:li:fsd_profile:1",
+    }
+
+
+def test_search_cache_keeps_result_elements_intact(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        return mock_response(search_page(["a"]))
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    api.search({"keywords": "python"}, limit=1)[0]["entityUrn"] = "changed"
+    results = api.search({"keywords": "python"}, limit=1)
+    assert [result["entityUrn"] for result in results] == ["a"]
+    assert len(calls) == 1
+
+
+def test_get_company_cache_keeps_nested_values_intact(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def fetch(uri, **kwargs):
+        calls.append(uri)
+        return mock_response({"elements": [{"specialities": ["python"]}]})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    api.get_company("acme")["specialities"].append("java")
+    assert api.get_company("acme") == {"specialities": ["python"]}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_feed_updates_page_past_short_pages(monkeypatch, max_workers):
+    monkeypatch.setattr(Linkedin, "_MAX_UPDATE_COUNT", 2)
+    api = Linkedin("test", "test", authenticate=False, max_workers=max_workers)
+    updates = ["a", "b", "c"]
+
+    def fetch(uri, **kwargs):
+        start = kwargs["params"]["start"]
+        # the first page comes back short although more updates follow
+        elements = updates[:1] if start == 0 else updates[start : start + 2]
+        return mock_response({"elements": elements})
+
+    monkeypatch.setattr(api, "_fetch", fetch)
+    assert api.get_company_updates(public_id="acme") == updates
+    assert list(api.iter_company_updates(public_id="acme")) == updates
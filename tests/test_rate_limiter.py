@@ -0,0 +1,67 @@
+import requests
+
+from linkedin_api.utils import rate_limiter
+from linkedin_api.utils.rate_limiter import RateLimiter
+
+
+def mock_response(status_code=200, headers=None):
+    res = requests.models.Response()
+    res.status_code = status_code
+    res.headers.update(headers or {})
+    return res
+
+
+def test_success_increases_rate():
+    limiter = RateLimiter(requests_per_minute=10, increase=1)
+    limiter.update(mock_response(200))
+    assert limiter.requests_per_minute == 11
+
+
+def test_rate_is_capped():
+    limiter = RateLimiter(requests_per_minute=10, max_requests_per_minute=10)
+    limiter.update(mock_response(200))
+    assert limiter.requests_per_minute == 10
+
+
+def test_rate_limited_decreases_rate_and_pauses():
+    limiter = RateLimiter(requests_per_minute=10, decrease=0.5)
+    limiter.update(mock_response(429, {"Retry-After": "30"}))
+    assert limiter.requests_per_minute == 5
+    assert limiter._paused_until > 0
+
+
+def test_server_error_decreases_rate_to_floor():
+    limiter = RateLimiter(requests_per_minute=3, min_requests_per_minute=2)
+    limiter.update(mock_response(503))
+    assert limiter.requests_per_minute == 2
+
+
+def test_low_remaining_header_pauses():
+    limiter = RateLimiter()
+    limiter.update(
+        mock_response(
+            200,
+            {
+                "x-ratelimit-limit-requests": "100",
+                "x-ratelimit-remaining-requests": "5",
+            },
+        )
+    )
+    assert limiter._paused_until > 0
+
+
+def test_first_request_is_not_delayed():
+    limiter = RateLimiter(jitter=0)
+    limiter.wait_if_throttled()
+    assert len(limiter._timestamps) == 1
+
+
+def test_burst_is_not_delayed(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+    limiter = RateLimiter(requests_per_minute=6, jitter=0, burst=3)
+    for _ in range(3):
+        limiter.wait_if_throttled()
+    assert sleeps == []
+    limiter.wait_if_throttled()
+    assert len(sleeps) == 1 and 9 < sleeps[0] <= 10
@@ -0,0 +1,48 @@
+from linkedin_api.utils import ttl_cache
+from linkedin_api.utils.ttl_cache import TTLCache
+
+
+def test_get_returns_cached_value():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    now[0] += 11
+    assert cache.get("a") is None
+
+
+def test_entry_ttl_is_capped_by_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=60)
+    now[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    now[0] += 5
+    assert cache.get("long") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_zero_ttl_disables_cache():
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None